@@ -1,13 +1,23 @@
 
+import hashlib
+import heapq
+import importlib.util
 import json
+import math
 import os
+import pickle
 import random
 import re
 import sys
+from array import array
 from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from datetime import datetime
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from datetime import date, datetime
+from functools import lru_cache
+from itertools import compress
+from operator import attrgetter, itemgetter
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
 
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
@@ -25,39 +35,145 @@ DEFAULT_LIBRARY_COLUMN_WIDTHS = {
     "Genres": 220,
 }
 
-# Optional stats charts (recommended)
-try:
-    from matplotlib.figure import Figure
-    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-    _HAS_MPL = True
-except Exception:
-    Figure = None
-    FigureCanvasTkAgg = None
-    _HAS_MPL = False
+def _module_available(name: str) -> bool:
+    try:
+        return importlib.util.find_spec(name) is not None
+    except Exception:
+        return False
 
 
+# Optional stats charts (recommended)
+# matplotlib is only imported (via _ensure_mpl) when a chart tab is first shown;
+# it is by far the slowest import and many sessions never open the charts.
+Figure = None
+FigureCanvasTkAgg = None
+_HAS_MPL = _module_available("matplotlib")
+_MPL_LOADED = False
+
+
+def _ensure_mpl() -> bool:
+    """Import matplotlib on first use; returns whether charts are usable."""
+    global Figure, FigureCanvasTkAgg, _HAS_MPL, _MPL_LOADED
+    if _HAS_MPL and not _MPL_LOADED:
+        try:
+            from matplotlib.figure import Figure as _Figure
+            from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg as _FigureCanvasTkAgg
+            Figure, FigureCanvasTkAgg = _Figure, _FigureCanvasTkAgg
+            _MPL_LOADED = True
+        except Exception:
+            _HAS_MPL = False
+    return _HAS_MPL
 
 
 # Optional cover support (recommended)
 # Requires: pip install pillow requests
-try:
-    from PIL import Image, ImageTk  # type: ignore
-    _HAS_PIL = True
-except Exception:
-    Image = None
-    ImageTk = None
-    _HAS_PIL = False
+# Pillow is imported (via _ensure_pil) when the first cover is rendered.
+Image = None
+ImageTk = None
+_HAS_PIL = _module_available("PIL")
+
+
+def _ensure_pil() -> bool:
+    """Import Pillow on first use; returns whether covers can be rendered."""
+    global Image, ImageTk, _HAS_PIL
+    if _HAS_PIL and ImageTk is None:
+        try:
+            from PIL import Image as _Image, ImageTk as _ImageTk  # type: ignore
+            Image, ImageTk = _Image, _ImageTk
+        except Exception:
+            _HAS_PIL = False
+    return _HAS_PIL
 
 try:
     # cover_cache.py should be in the same folder as this script
     from cover_cache import CoverCache, choose_best_isbn, normalize_isbn  # type: ignore
+    from cover_cache import json_loads as _json_loads  # type: ignore
     _HAS_COVER_CACHE = True
 except Exception:
     CoverCache = None  # type: ignore
     choose_best_isbn = None  # type: ignore
     normalize_isbn = None  # type: ignore
+    _json_loads = json.loads  # type: ignore
     _HAS_COVER_CACHE = False
 
+# Optional vectorized stats (numpy is installed alongside matplotlib)
+# Imported lazily (via _ensure_numpy) on the first stats refresh.
+np = None
+_HAS_NUMPY = _module_available("numpy")
+
+
+def _ensure_numpy() -> bool:
+    """Import numpy on first use; returns whether vectorized stats are available."""
+    global np, _HAS_NUMPY
+    if _HAS_NUMPY and np is None:
+        try:
+            import numpy as _np  # type: ignore
+            np = _np
+        except Exception:
+            _HAS_NUMPY = False
+    return _HAS_NUMPY
+
+
+# Optional fast JSON (recommended for large exports)
+# Requires: pip install orjson
+try:
+    import orjson  # type: ignore
+    _HAS_ORJSON = True
+except Exception:
+    orjson = None  # type: ignore
+    _HAS_ORJSON = False
+
+
+# Optional streaming JSON parser (keeps peak memory low on very large exports)
+# Requires: pip install ijson
+try:
+    import ijson  # type: ignore
+    _HAS_IJSON = True
+except Exception:
+    ijson = None  # type: ignore
+    _HAS_IJSON = False
+
+# Library files at least this large are stream-parsed when ijson is available.
+_STREAM_PARSE_MIN_BYTES = 32 * 1024 * 1024
+
+
+def _json_dumps_pretty(obj: Any) -> bytes:
+    """Serialize to indented UTF-8 JSON bytes (orjson when available)."""
+    if _HAS_ORJSON:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+        except orjson.JSONEncodeError:
+            # e.g. integers beyond 64 bits; stdlib handles these.
+            pass
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _load_json_file(path: str) -> Any:
+    with open(path, "rb") as f:
+        return _json_loads(f.read())
+
+
+def iter_records_from_path(path: str) -> Iterable[Tuple[str, Any]]:
+    """
+    Stream (books_id, record) pairs from a LibraryThing JSON export with ijson,
+    without materializing the whole top-level dict.
+    """
+    with open(path, "rb") as f:
+        head = f.read(64).lstrip()
+        if head.startswith(b"\xef\xbb\xbf"):
+            head = head[3:].lstrip()
+        if not head.startswith(b"{"):
+            raise ValueError("Top-level JSON must be an object (dict).")
+        f.seek(0)
+        yield from ijson.kvitems(f, "", use_float=True)
+
+
+# Cover prefetch after a library load: how many rows (from the top of the
+# Library view) to warm, and how many prefetch jobs (a get_many download batch,
+# a search_batch) to run at once. Downloads fan out on CoverCache's own pool.
+_COVER_PREFETCH_ROWS = 50
+_COVER_PREFETCH_WORKERS = 2
+
 
 # ----------------------------
 # Settings (persisted to JSON)
@@ -79,28 +195,52 @@ _DEFAULT_SETTINGS = {
 
 def _settings_path(settings_dir: str) -> str:
     return os.path.join(settings_dir, "bookstats_settings.json")
+# Last bytes written to (or read from) each settings file; lets save_settings
+# skip rewriting an unchanged file.
+_last_settings_bytes: Dict[str, bytes] = {}
+
+
 def load_settings(settings_dir: str) -> Dict[str, Any]:
     path = _settings_path(settings_dir)
     if not os.path.exists(path):
         return dict(_DEFAULT_SETTINGS)
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        with open(path, "rb") as f:
+            raw = f.read()
+        data = _json_loads(raw)
         if not isinstance(data, dict):
             return dict(_DEFAULT_SETTINGS)
+        _last_settings_bytes[path] = raw
         out = dict(_DEFAULT_SETTINGS)
         out.update(data)
         return out
     except Exception:
         return dict(_DEFAULT_SETTINGS)
 
+def _ensure_json_backup(path: str) -> None:
+    """Keep a one-time copy of a library file as path + ".bak" before the app edits it."""
+    backup = path + ".bak"
+    if os.path.exists(backup):
+        return
+    try:
+        import shutil
+        shutil.copy2(path, backup)
+    except Exception:
+        pass
+
 def save_settings(settings_dir: str, settings: Dict[str, Any]) -> None:
     path = _settings_path(settings_dir)
     tmp = path + ".tmp"
     try:
-        with open(tmp, "w", encoding="utf-8") as f:
-            json.dump(settings, f, indent=2, ensure_ascii=False)
+        payload = _json_dumps_pretty(settings)
+        if _last_settings_bytes.get(path) == payload and os.path.exists(path):
+            return
+        with open(tmp, "wb") as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
         os.replace(tmp, path)
+        _last_settings_bytes[path] = payload
     except Exception:
         # Best-effort; avoid crashing the app if disk is read-only, etc.
         try:
@@ -159,6 +299,17 @@ def get_app_dirs(app_dir: str) -> tuple[str, str]:
     return data_dir, cache_dir
 
 
+# Precompiled patterns for the per-record parsing helpers below.
+_RE_DIGITS = re.compile(r"(\d+)")
+_RE_YEAR = re.compile(r"(\d{4})")
+_RE_ISBN_STRIP = re.compile(r"[^0-9Xx]")
+
+_TRUE_STRS = frozenset({"1", "true", "yes", "y", "t"})
+_FALSE_STRS = frozenset({"0", "false", "no", "n", "f", ""})
+_TOREAD_STRS = frozenset({"to read", "to-read", "toread"})
+_ISBN13_PREFIXES = frozenset({"978", "979"})
+
+
 def _as_list(v: Any) -> List[Any]:
     if v is None:
         return []
@@ -166,15 +317,33 @@ def _as_list(v: Any) -> List[Any]:
         return v
     if isinstance(v, dict):
         # LibraryThing sometimes uses dicts like {"0": "...", "2": "..."} for ISBN etc.
-        items = list(v.items())
-        items.sort(key=lambda x: str(x[0]))
-        return [x[1] for x in items]
+        # Keys are normally list positions, so order them numerically; fall back
+        # to string order for non-numeric keys like "isbn10"/"isbn13".
+        try:
+            items = sorted(v.items(), key=lambda kv: int(kv[0]))
+        except (TypeError, ValueError):
+            items = sorted(v.items(), key=lambda kv: str(kv[0]))
+        return [val for _, val in items]
     return [v]
 
 
 def _safe_float(v: Any) -> Optional[float]:
-    if v is None or v == "":
+    if v is None:
         return None
+    # Dispatch on the common JSON types first; only odd values pay for try/except.
+    t = type(v)
+    if t is float:
+        return v
+    if t is int:
+        return float(v)
+    if t is str:
+        s = v.strip()
+        if not s:
+            return None
+        try:
+            return float(s)
+        except ValueError:
+            return None
     try:
         return float(v)
     except Exception:
@@ -190,19 +359,20 @@ def _safe_bool(v: Any) -> bool:
     if isinstance(v, (int, float)):
         return v != 0
     s = str(v).strip().lower()
-    if s in {"1", "true", "yes", "y", "t"}:
+    if s in _TRUE_STRS:
         return True
-    if s in {"0", "false", "no", "n", "f", ""}:
+    if s in _FALSE_STRS:
         return False
     # Fallback: non-empty strings count as True
     return True
 
 
-def _digits_to_int(v: Any) -> Optional[int]:
-    if v is None:
-        return None
-    s = str(v)
-    m = re.search(r"(\d+)", s)
+# The helpers below see heavily repeated raw values across a library (page
+# strings, publication dates, ISBN sets), so the string-level work is memoized.
+
+@lru_cache(maxsize=8192)
+def _digits_to_int_str(s: str) -> Optional[int]:
+    m = _RE_DIGITS.search(s)
     if not m:
         return None
     try:
@@ -211,11 +381,17 @@ def _digits_to_int(v: Any) -> Optional[int]:
         return None
 
 
-def _parse_year(v: Any) -> Optional[int]:
+def _digits_to_int(v: Any) -> Optional[int]:
     if v is None:
         return None
-    s = str(v).strip()
-    m = re.search(r"(\d{4})", s)
+    if type(v) is int and v >= 0:
+        return v
+    return _digits_to_int_str(str(v))
+
+
+@lru_cache(maxsize=8192)
+def _parse_year_str(s: str) -> Optional[int]:
+    m = _RE_YEAR.search(s)
     if not m:
         return None
     try:
@@ -224,6 +400,12 @@ def _parse_year(v: Any) -> Optional[int]:
         return None
 
 
+def _parse_year(v: Any) -> Optional[int]:
+    if v is None:
+        return None
+    return _parse_year_str(str(v).strip())
+
+
 def _extract_best_isbn(raw: Dict[str, Any]) -> str:
     """
     Extract a usable ISBN (prefer ISBN-13) from LibraryThing export fields.
@@ -233,6 +415,17 @@ def _extract_best_isbn(raw: Dict[str, Any]) -> str:
       - a list of strings
       - a single string
     """
+    # Fast path: most records lead with a clean ISBN-13, which always wins.
+    first = raw.get("isbn")
+    if isinstance(first, dict):
+        first = next(iter(first.values()), None)
+    elif isinstance(first, list):
+        first = first[0] if first else None
+    if isinstance(first, str):
+        s = _RE_ISBN_STRIP.sub("", first).upper()
+        if len(s) == 13 and s[:3] in _ISBN13_PREFIXES and s.isdigit():
+            return s
+
     candidates: List[str] = []
 
     for field in ("isbn", "originalisbn"):
@@ -244,7 +437,12 @@ def _extract_best_isbn(raw: Dict[str, Any]) -> str:
         else:
             candidates.extend([str(x) for x in _as_list(v) if x is not None])
 
-    candidates = [c for c in (str(x).strip() for x in candidates) if c]
+    return _best_isbn_from_candidates(tuple(candidates))
+
+
+@lru_cache(maxsize=8192)
+def _best_isbn_from_candidates(raw_candidates: Tuple[str, ...]) -> str:
+    candidates = [c for c in (x.strip() for x in raw_candidates) if c]
     if not candidates:
         return ""
 
@@ -257,7 +455,7 @@ def _extract_best_isbn(raw: Dict[str, Any]) -> str:
     # Minimal fallback: prefer 13-digit ISBNs starting with 978/979
     cleaned = []
     for c in candidates:
-        s = re.sub(r"[^0-9Xx]", "", c).upper()
+        s = _RE_ISBN_STRIP.sub("", c).upper()
         if len(s) in (10, 13):
             cleaned.append(s)
 
@@ -267,17 +465,29 @@ def _extract_best_isbn(raw: Dict[str, Any]) -> str:
     return cleaned[0] if cleaned else ""
 
 
-def _parse_date_yyyy_mm_dd(v: Any) -> Optional[datetime]:
-    if not v:
-        return None
-    s = str(v).strip()
+@lru_cache(maxsize=8192)
+def _parse_date_str(s: str) -> Optional[datetime]:
+    # Fast path for the canonical zero-padded form: fromisoformat is a C parser,
+    # strptime re-parses its format every call.
+    if len(s) == 10 and s[4] == "-" and s[7] == "-":
+        try:
+            return datetime.fromisoformat(s)
+        except ValueError:
+            pass
+    # Anything else (e.g. "2020-1-5") keeps strptime's exact semantics.
     try:
         return datetime.strptime(s, "%Y-%m-%d")
     except Exception:
         return None
 
 
-@dataclass
+def _parse_date_yyyy_mm_dd(v: Any) -> Optional[datetime]:
+    if not v:
+        return None
+    return _parse_date_str(str(v).strip())
+
+
+@dataclass(slots=True)
 class Book:
     books_id: str
     title: str
@@ -298,67 +508,178 @@ class Book:
     summary: str = ""
     summary_checked: bool = False
 
-    @property
-    def display_author(self) -> str:
-        # Prefer primaryauthor; if missing, fall back to first author in authors list
-        if self.primaryauthor:
-            return self.primaryauthor
-        if self.authors:
-            return self.authors[0]
-        return ""
+    # Derived fields, computed once in __post_init__ (collections, dateread and
+    # authors don't change after parsing). Filters/sorts read these directly.
+    is_read: bool = field(default=False, init=False, repr=False, compare=False)
+    is_unread: bool = field(default=False, init=False, repr=False, compare=False)
+    is_owned: bool = field(default=False, init=False, repr=False, compare=False)
+    is_to_read: bool = field(default=False, init=False, repr=False, compare=False)
+    author_last: str = field(default="", init=False, repr=False, compare=False)
+    display_author_lower: str = field(default="", init=False, repr=False, compare=False)
+    title_lower: str = field(default="", init=False, repr=False, compare=False)
+    # primaryauthor, falling back to the first of authors
+    display_author: str = field(default="", init=False, repr=False, compare=False)
+    # Prebuilt Library sort keys (see BookStatsApp._sort_key_for)
+    _sort_key_author: Tuple[str, str, str] = field(default=("", "", ""), init=False, repr=False, compare=False)
+    _sort_key_title: Tuple[str, str, str] = field(default=("", "", ""), init=False, repr=False, compare=False)
+    _sort_key_year: Tuple[bool, int, str] = field(default=(True, 0, ""), init=False, repr=False, compare=False)
+    _sort_key_pages: Tuple[bool, int, str] = field(default=(True, 0, ""), init=False, repr=False, compare=False)
+    _sort_key_rating: Tuple[bool, float, str] = field(default=(True, 0.0, ""), init=False, repr=False, compare=False)
+    _sort_key_format: Tuple[str, str] = field(default=("", ""), init=False, repr=False, compare=False)
+    _sort_key_tags: Tuple[str, str] = field(default=("", ""), init=False, repr=False, compare=False)
+    _sort_key_collections: Tuple[str, str] = field(default=("", ""), init=False, repr=False, compare=False)
+    _sort_key_genres: Tuple[str, str] = field(default=("", ""), init=False, repr=False, compare=False)
+    # Joined display strings (Treeview rows, search, sort keys)
+    _collections_str: str = field(default="", init=False, repr=False, compare=False)
+    _genre_str: str = field(default="", init=False, repr=False, compare=False)
+    _genre_str_lower: str = field(default="", init=False, repr=False, compare=False)
+    _authors_str: str = field(default="", init=False, repr=False, compare=False)
+    _tags_str: str = field(default="", init=False, repr=False, compare=False)
+    _formats_str: str = field(default="", init=False, repr=False, compare=False)
+    _primary_format: str = field(default="", init=False, repr=False, compare=False)
+    # Parsed Date Read / Entry Date (None when missing or unparseable)
+    _dateread_parsed: Optional[datetime] = field(default=None, init=False, repr=False, compare=False)
+    _entrydate_parsed: Optional[datetime] = field(default=None, init=False, repr=False, compare=False)
+    # Lowercased text the Library search box matches against
+    search_hay: str = field(default="", init=False, repr=False, compare=False)
+    # Book Details field lines, built on first use (see details_text)
+    _details_text: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        cols = self.collections
+        self.is_read = "Read" in cols or (self.dateread is not None and str(self.dateread).strip() != "")
+        self.is_unread = ("Unread" in cols) and not self.is_read
+        self.is_owned = "Owned" in cols
+        # Use explicit LibraryThing collection (case-insensitive), e.g. "To read".
+        # User requested this be driven by the JSON collection rather than derived.
+        self.is_to_read = not _TOREAD_STRS.isdisjoint(str(c).strip().lower() for c in cols)
 
-    @property
-    def author_last(self) -> str:
+        # Prefer primaryauthor; if missing, fall back to first author in authors list
+        self.display_author = self.primaryauthor or (self.authors[0] if self.authors else "")
         a = self.display_author.strip()
         if not a:
-            return ""
-        # Handle "Last, First"
-        if "," in a:
-            return a.split(",", 1)[0].strip().lower()
-        # Otherwise "First Last"
-        parts = a.split()
-        return parts[-1].strip().lower() if parts else a.lower()
-
-    @property
-    def is_read(self) -> bool:
-        return "Read" in self.collections or (self.dateread is not None and str(self.dateread).strip() != "")
-
-    @property
-    def is_unread(self) -> bool:
-        return ("Unread" in self.collections) and not self.is_read
-
-    @property
-    def is_owned(self) -> bool:
-        return "Owned" in self.collections
-
-    @property
-    def is_to_read(self) -> bool:
-        # Use explicit LibraryThing collection (case-insensitive), e.g. "To read".
-        # User requested this be driven by the JSON collection rather than derived.
-        return any(str(c).strip().lower() in {"to read", "to-read", "toread"} for c in self.collections)
+            last = ""
+        elif "," in a:
+            # Handle "Last, First"
+            last = a.split(",", 1)[0].strip().lower()
+        else:
+            # Otherwise "First Last"
+            parts = a.split()
+            last = parts[-1].strip().lower() if parts else a.lower()
+        self.author_last = last
+
+        author_l = self.display_author_lower = self.display_author.lower()
+        title_l = self.title_lower = self.title.lower()
+        self._sort_key_author = (last, author_l, title_l)
+        self._sort_key_title = (title_l, last, author_l)
+        self._sort_key_year = (self.year is None, self.year if self.year is not None else 0, title_l)
+        self._sort_key_pages = (self.pages is None, self.pages if self.pages is not None else 0, title_l)
+        self._sort_key_rating = (self.rating is None, self.rating if self.rating is not None else 0.0, title_l)
+
+        self._collections_str = ", ".join(cols)
+        self._genre_str = ", ".join(self.genre)
+        self._authors_str = ", ".join(self.authors)
+        self._tags_str = ", ".join(self.tags)
+        self._formats_str = ", ".join(self.formats)
+        self._primary_format = self.formats[0] if self.formats else ""
+
+        self._sort_key_format = (self._primary_format.lower(), title_l)
+        self._sort_key_tags = (self._tags_str.lower(), title_l)
+        self._sort_key_collections = (self._collections_str.lower(), title_l)
+        self._genre_str_lower = self._genre_str.lower()
+        self._sort_key_genres = (self._genre_str_lower, title_l)
+
+        self._dateread_parsed = _parse_date_yyyy_mm_dd(self.dateread)
+        self._entrydate_parsed = _parse_date_yyyy_mm_dd(self.entrydate)
+
+        self.search_hay = " | ".join([
+            self.title,
+            self.display_author,
+            self.publication,
+            self._collections_str,
+            self._genre_str,
+            self._tags_str,
+            self._formats_str,
+            " ".join(self.series),
+        ]).lower()
 
     def collections_str(self) -> str:
-        return ", ".join(self.collections)
+        return self._collections_str
+
+    def details_text(self) -> str:
+        """The Title .. Publication lines of the Book Details text (no summary)."""
+        if self._details_text is not None:
+            return self._details_text
+        lines: List[str] = [f"Title: {self.title}"]
+        if self.display_author:
+            lines.append(f"Author: {self.display_author}")
+        if self.year:
+            lines.append(f"Year: {self.year}")
+        if self.pages:
+            lines.append(f"Pages: {self.pages}")
+        if self.isbn:
+            lines.append(f"ISBN: {self.isbn}")
+        if self._primary_format:
+            lines.append(f"Format: {self._primary_format}")
+        if self.tags:
+            lines.append(f"Tags: {self._tags_str}")
+        if self.rating is not None:
+            lines.append(f"Rating: {self.rating:g}")
+        if self.collections:
+            lines.append(f"Collections: {self._collections_str}")
+        if self.genre:
+            lines.append(f"Genres: {self._genre_str}")
+        if self.series:
+            lines.append(f"Series: {', '.join(self.series)}")
+        if self.dateread:
+            lines.append(f"Date read: {self.dateread}")
+        if self.entrydate:
+            lines.append(f"Entry date: {self.entrydate}")
+        if self.publication:
+            lines.append(f"Publication: {self.publication}")
+        self._details_text = "\n".join(lines)
+        return self._details_text
 
     def genre_str(self) -> str:
-        return ", ".join(self.genre)
+        return self._genre_str
 
     def authors_str(self) -> str:
-        return ", ".join(self.authors)
+        return self._authors_str
 
     def tags_str(self) -> str:
-        return ", ".join(self.tags)
+        return self._tags_str
 
     def formats_str(self) -> str:
-        return ", ".join(self.formats)
+        return self._formats_str
 
     def primary_format(self) -> str:
-        return self.formats[0] if self.formats else ""
+        return self._primary_format
+
+
+def _clean_str_list(v: Any) -> List[str]:
+    """
+    Coerce a LibraryThing list-ish field to stripped, non-empty strings.
+
+    The strings are interned: collections/tags/genres repeat across most books.
+    """
+    out: List[str] = []
+    for x in _as_list(v):
+        sx = str(x).strip()
+        if sx:
+            out.append(sys.intern(sx))
+    return out
 
 
 def parse_books(data: Dict[str, Any]) -> List[Book]:
     """
     Parse the LibraryThing JSON export (a dict keyed by books_id) into Book objects.
+    """
+    return parse_book_records(data.items(), size_hint=len(data))
+
+
+def parse_book_records(records: Iterable[Tuple[Any, Any]], size_hint: int = 0) -> List[Book]:
+    """
+    Parse (books_id, record) pairs from a LibraryThing export into Book objects.
 
     Notes on known fields in your export:
       - collections: ["Owned","Unread"] etc.
@@ -367,80 +688,466 @@ def parse_books(data: Dict[str, Any]) -> List[Book]:
       - dateread: "YYYY-MM-DD"
       - entrydate: "YYYY-MM-DD"
     """
-    books: List[Book] = []
-    for key, raw in data.items():
-        if not isinstance(raw, dict):
+    # Hoist globals/builtins to locals: this loop runs once per record.
+    as_list = _as_list
+    clean_str_list = _clean_str_list
+    safe_float = _safe_float
+    safe_bool = _safe_bool
+    digits_to_int = _digits_to_int
+    parse_year = _parse_year
+    extract_best_isbn = _extract_best_isbn
+    make_book = Book
+    intern = sys.intern
+    str_ = str
+    isinstance_ = isinstance
+    dict_ = dict
+
+    books: List[Any] = [None] * size_hint
+    n = 0
+    for key, raw in records:
+        if not isinstance_(raw, dict_):
             continue
+        get = raw.get
 
-        books_id = str(raw.get("books_id") or key)
-        title = str(raw.get("title") or "").strip()
-        primaryauthor = str(raw.get("primaryauthor") or "").strip()
+        books_id = str_(get("books_id") or key)
+        title = str_(get("title") or "").strip()
+        primaryauthor = intern(str_(get("primaryauthor") or "").strip())
 
-        author_objs = _as_list(raw.get("authors"))
         authors: List[str] = []
-        for a in author_objs:
-            if isinstance(a, dict):
+        for a in as_list(get("authors")):
+            if isinstance_(a, dict_):
                 nm = (a.get("fl") or a.get("lf") or "").strip()
                 if nm:
-                    authors.append(nm)
-            elif isinstance(a, str) and a.strip():
-                authors.append(a.strip())
-
-        collections = [str(x).strip() for x in _as_list(raw.get("collections")) if str(x).strip()]
-        tags = [str(x).strip() for x in _as_list(raw.get("tags")) if str(x).strip()]
-        genre = [str(x).strip() for x in _as_list(raw.get("genre")) if str(x).strip()]
-        series = [str(x).strip() for x in _as_list(raw.get("series")) if str(x).strip()]
+                    authors.append(intern(nm))
+            elif isinstance_(a, str_):
+                nm = a.strip()
+                if nm:
+                    authors.append(intern(nm))
 
         # format looks like: [{"code": "...", "text": "Hardcover"}]
+        # De-dupe case-insensitively while preserving order, lowering each entry once.
         formats: List[str] = []
-        for fe in _as_list(raw.get("format")):
-            if isinstance(fe, dict):
-                t = str(fe.get("text") or "").strip()
-                if t:
-                    formats.append(t)
-            elif isinstance(fe, str) and fe.strip():
-                formats.append(fe.strip())
-        # de-dupe while preserving order
-        seen = set()
-        formats = [x for x in formats if not (x.lower() in seen or seen.add(x.lower()))]
-
-        rating = _safe_float(raw.get("rating"))
-        pages = _digits_to_int(raw.get("pages"))
-        year = _parse_year(raw.get("date"))
-
-        isbn = _extract_best_isbn(raw)
-
-        book = Book(
+        seen_formats = set()
+        for fe in as_list(get("format")):
+            if isinstance_(fe, dict_):
+                t = str_(fe.get("text") or "").strip()
+            elif isinstance_(fe, str_):
+                t = fe.strip()
+            else:
+                continue
+            if not t:
+                continue
+            low = t.lower()
+            if low not in seen_formats:
+                seen_formats.add(low)
+                formats.append(intern(t))
+
+        book = make_book(
             books_id=books_id,
             title=title,
             primaryauthor=primaryauthor,
             authors=authors,
-            collections=collections,
-            tags=tags,
+            collections=clean_str_list(get("collections")),
+            tags=clean_str_list(get("tags")),
             formats=formats,
-            genre=genre,
-            series=series,
-            rating=rating,
-            pages=pages,
-            year=year,
-            isbn=isbn,
-            dateread=str(raw.get("dateread") or "").strip() or None,
-            entrydate=str(raw.get("entrydate") or "").strip() or None,
-            publication=str(raw.get("publication") or "").strip(),
-            summary=str(raw.get("summary") or "").strip(),
-            summary_checked=_safe_bool(raw.get("summary_checked")),
+            genre=clean_str_list(get("genre")),
+            series=clean_str_list(get("series")),
+            rating=safe_float(get("rating")),
+            pages=digits_to_int(get("pages")),
+            year=parse_year(get("date")),
+            isbn=extract_best_isbn(raw),
+            dateread=str_(get("dateread") or "").strip() or None,
+            entrydate=str_(get("entrydate") or "").strip() or None,
+            publication=str_(get("publication") or "").strip(),
+            summary=str_(get("summary") or "").strip(),
+            summary_checked=safe_bool(get("summary_checked")),
         )
-        books.append(book)
+        if n < size_hint:
+            books[n] = book
+        else:
+            books.append(book)
+        n += 1
+    del books[n:]
 
     # Default sort: author last name, then title
-    books.sort(key=lambda b: (b.author_last, b.display_author.lower(), b.title.lower()))
+    books.sort(key=attrgetter("_sort_key_author"))
     return books
 
 
+# Library "Quick filter" choices -> predicate ("All" and unknown values keep every book)
+_QUICK_FILTERS = {
+    "Read": attrgetter("is_read"),
+    "Unread": attrgetter("is_unread"),
+    "To Read": attrgetter("is_to_read"),
+    "Owned": attrgetter("is_owned"),
+    "Unowned": lambda b: not b.is_owned,
+}
+
+
+def _intersect_postings(postings: List[List[int]]) -> List[int]:
+    """Intersect ascending index lists, smallest first; returns ascending indices."""
+    if len(postings) == 1:
+        return postings[0]
+    postings = sorted(postings, key=len)
+    common = set(postings[0])
+    for p in postings[1:]:
+        if not common:
+            break
+        common.intersection_update(p)
+    return sorted(common)
+
+
+def _year_counter(y0: int, values: Any, present: Any = None) -> Counter:
+    """Turn a bincount over (year - y0) into {year: int(value)} for years where present > 0."""
+    vals = values.tolist()
+    pres = vals if present is None else present.tolist()
+    return Counter({y0 + i: int(v) for i, (v, n) in enumerate(zip(vals, pres)) if n})
+
+
+def _top_n(counter: Counter, n: int = 20) -> List[Tuple[Any, int]]:
+    """Return the n highest-count (key, count) pairs, ties in insertion order."""
+    if len(counter) <= n:
+        return sorted(counter.items(), key=itemgetter(1), reverse=True)
+    return heapq.nlargest(n, counter.items(), key=itemgetter(1))
+
+
+_MISSING_INT = -1
+_INT64_MAX = (1 << 63) - 1
+
+
+@dataclass
+class BookColumns:
+    """
+    Numeric Book fields stored column-wise (one flat array per field, aligned
+    with the book list) so stats can scan contiguous buffers instead of
+    chasing Book objects.
+
+    Missing values: ratings are NaN; pages/years/dates are _MISSING_INT.
+    read_years/read_days come from Date Read (read books only, days as
+    proleptic ordinals); added_years comes from Entry Date.
+    """
+    ratings: array = field(default_factory=lambda: array("d"))
+    pages: array = field(default_factory=lambda: array("q"))
+    years: array = field(default_factory=lambda: array("q"))
+    is_read: array = field(default_factory=lambda: array("b"))
+    read_years: array = field(default_factory=lambda: array("q"))
+    read_days: array = field(default_factory=lambda: array("q"))
+    added_years: array = field(default_factory=lambda: array("q"))
+
+    def __len__(self) -> int:
+        return len(self.ratings)
+
+    def known_ratings(self) -> List[float]:
+        return [r for r in self.ratings if not math.isnan(r)]
+
+    def known_pages(self) -> List[int]:
+        return [p for p in self.pages if p != _MISSING_INT]
+
+
+def build_book_columns(books: List[Book]) -> BookColumns:
+    nan = math.nan
+    missing = _MISSING_INT
+    ratings = [nan if b.rating is None else b.rating for b in books]
+    pages = [missing if (b.pages is None or b.pages > _INT64_MAX) else b.pages for b in books]
+    years = [missing if (b.year is None or b.year > _INT64_MAX) else b.year for b in books]
+    read_dates = [b._dateread_parsed if b.is_read else None for b in books]
+    added = [b._entrydate_parsed for b in books]
+    return BookColumns(
+        ratings=array("d", ratings),
+        pages=array("q", pages),
+        years=array("q", years),
+        is_read=array("b", [b.is_read for b in books]),
+        read_years=array("q", [missing if d is None else d.year for d in read_dates]),
+        read_days=array("q", [missing if d is None else d.toordinal() for d in read_dates]),
+        added_years=array("q", [missing if d is None else d.year for d in added]),
+    )
+
+
+@dataclass
+class LibraryStats:
+    """Statistics tab contents produced by compute_library_stats."""
+    summary: str
+    top_authors: List[Tuple[str, int]]
+    top_genres: List[Tuple[str, int]]
+    top_collections: List[Tuple[str, int]]
+    top_formats: List[Tuple[str, int]]
+    top_tags: List[Tuple[str, int]]
+    yr_books: Counter
+    yr_pages: Counter
+    yr_ratings_sum: Dict[int, float]
+    yr_ratings_n: Counter
+    yr_added: Counter
+    formats: Counter
+    ratings_all: Sequence[float]
+    tags: Counter
+
+
+def compute_library_stats(books: List[Book], cols: BookColumns, by_quick: Dict[str, List[int]]) -> LibraryStats:
+    """
+    Aggregate the Statistics tab data for a non-empty library. Pure (no Tk), so
+    BookStatsApp.refresh_stats runs it on a worker thread.
+    """
+    total = len(books)
+    # Status counts are just the sizes of the quick-filter postings
+    read = len(by_quick.get("Read", ()))
+    unread = len(by_quick.get("Unread", ()))
+    to_read = len(by_quick.get("To Read", ()))
+    owned = len(by_quick.get("Owned", ()))
+    unowned = total - owned
+
+    missing = _MISSING_INT
+    ratings_all: Sequence[float]
+    ratings_read: Sequence[float]
+    if _ensure_numpy():
+        # Zero-copy views over the column buffers
+        ratings = np.frombuffer(cols.ratings, dtype=np.float64)
+        pages = np.frombuffer(cols.pages, dtype=np.int64)
+        is_read = np.frombuffer(cols.is_read, dtype=np.int8).astype(bool)
+        rated = ~np.isnan(ratings)
+        known_pages = pages != missing
+        ratings_all = ratings[rated]
+        ratings_read = ratings[rated & is_read]
+        avg_rating_all = float(ratings_all.mean()) if ratings_all.size else None
+        avg_rating_read = float(ratings_read.mean()) if ratings_read.size else None
+        pages_total = int(pages[known_pages].sum())
+        pages_read = int(pages[known_pages & is_read].sum())
+
+        # Yearly aggregates: bincount over year offsets instead of per-book dict updates
+        read_years = np.frombuffer(cols.read_years, dtype=np.int64)
+        dated = read_years != missing
+        yr_books = Counter()
+        yr_pages = Counter()
+        yr_ratings_sum: Dict[int, float] = {}
+        yr_ratings_n = Counter()
+        first_day = last_day = None
+        if dated.any():
+            days = np.frombuffer(cols.read_days, dtype=np.int64)[dated]
+            first_day, last_day = int(days.min()), int(days.max())
+            dated_years = read_years[dated]
+            y0 = int(dated_years.min())
+            offs = dated_years - y0
+            yr_books = _year_counter(y0, np.bincount(offs))
+            has_pages = known_pages[dated]
+            yr_pages = _year_counter(y0, np.bincount(offs[has_pages], weights=pages[dated][has_pages]),
+                                     np.bincount(offs[has_pages]))
+            has_rating = rated[dated]
+            rated_offs = offs[has_rating]
+            yr_ratings_n = _year_counter(y0, np.bincount(rated_offs))
+            sums = np.bincount(rated_offs, weights=ratings[dated][has_rating]).tolist()
+            yr_ratings_sum = {y: sums[y - y0] for y in yr_ratings_n}
+        added_years = np.frombuffer(cols.added_years, dtype=np.int64)
+        added_years = added_years[added_years != missing]
+        yr_added = Counter()
+        if added_years.size:
+            years_u, counts = np.unique(added_years, return_counts=True)
+            yr_added = Counter(dict(zip(years_u.tolist(), counts.tolist())))
+    else:
+        ratings_all = cols.known_ratings()
+        avg_rating_all = (sum(ratings_all) / len(ratings_all)) if ratings_all else None
+
+        ratings_read = [r for r, rd in zip(cols.ratings, cols.is_read) if rd and not math.isnan(r)]
+        avg_rating_read = (sum(ratings_read) / len(ratings_read)) if ratings_read else None
+
+        pages_total = sum(p for p in cols.pages if p != missing)
+        pages_read = sum(p for p, rd in zip(cols.pages, cols.is_read) if rd and p != missing)
+
+        yr_books = Counter()
+        yr_pages = Counter()
+        yr_ratings_sum = defaultdict(float)
+        yr_ratings_n = Counter()
+        first_day = last_day = None
+        for y, day, p, r in zip(cols.read_years, cols.read_days, cols.pages, cols.ratings):
+            if y == missing:
+                continue
+            if first_day is None or day < first_day:
+                first_day = day
+            if last_day is None or day > last_day:
+                last_day = day
+            yr_books[y] += 1
+            if p != missing:
+                yr_pages[y] += p
+            if not math.isnan(r):
+                yr_ratings_sum[y] += r
+                yr_ratings_n[y] += 1
+        yr_added = Counter(y for y in cols.added_years if y != missing)
+
+    # Values are gathered during the pass and counted afterwards: Counter(iterable)
+    # counts in C, unlike a Python-level `counter[k] += 1` per item.
+    authors_seen: List[str] = []
+    genres_seen: List[str] = []
+    collections_seen: List[str] = []
+    formats_seen: List[str] = []
+    tags_seen: List[str] = []
+
+    # One pass over the books feeds the text aggregates; dated/numeric ones came from the columns.
+    for b in books:
+        author = b.display_author
+        if author:
+            authors_seen.append(author)
+        genres_seen.extend(b.genre)
+        collections_seen.extend(b.collections)
+        fmt = b.primary_format()
+        if fmt:
+            formats_seen.append(fmt)
+        tags_seen.extend(b.tags)
+
+    authors = Counter(authors_seen)
+    genres = Counter(genres_seen)
+    collections = Counter(collections_seen)
+    formats = Counter(formats_seen)
+    tags = Counter(tags_seen)
+
+    unique_authors = len(authors)
+    unique_collections = len(collections)
+    unique_formats = len(formats)
+
+    first_read = date.fromordinal(first_day).isoformat() if first_day is not None else None
+    last_read = date.fromordinal(last_day).isoformat() if last_day is not None else None
+
+    busiest_year = None
+    if yr_books:
+        # Earliest year wins ties, whichever path built the counter
+        busiest_year, busiest_count = max(sorted(yr_books.items()), key=lambda kv: kv[1])
+    else:
+        busiest_count = 0
+
+    # Reading streak (consecutive years with >=1 read)
+    best_streak = 0
+    best_streak_range: Optional[Tuple[int, int]] = None
+    if yr_books:
+        years = sorted(yr_books.keys())
+        cur_start = years[0]
+        cur_prev = years[0]
+        cur_len = 1
+        for y in years[1:]:
+            if y == cur_prev + 1:
+                cur_prev = y
+                cur_len += 1
+            else:
+                if cur_len > best_streak:
+                    best_streak = cur_len
+                    best_streak_range = (cur_start, cur_prev)
+                cur_start = y
+                cur_prev = y
+                cur_len = 1
+        if cur_len > best_streak:
+            best_streak = cur_len
+            best_streak_range = (cur_start, cur_prev)
+
+    summary_lines = [
+        f"Total books: {total:,}",
+        f"Owned: {owned:,}   |   Unowned: {unowned:,}",
+        f"Read: {read:,}   |   Unread: {unread:,}   |   To Read (Owned+Unread): {to_read:,}",
+        f"Unique authors: {unique_authors:,}",
+        f"Unique collections: {unique_collections:,}",
+        f"Unique formats: {unique_formats:,}",
+        f"Total pages (where known): {pages_total:,}",
+        f"Pages read (where known): {pages_read:,}",
+    ]
+
+    if avg_rating_all is None:
+        summary_lines.append("Average rating (rated only): (no ratings found)")
+    else:
+        summary_lines.append(f"Average rating (rated only): {avg_rating_all:.2f}  (n={len(ratings_all):,})")
+
+    if avg_rating_read is not None:
+        summary_lines.append(f"Average rating (read + rated): {avg_rating_read:.2f}  (n={len(ratings_read):,})")
+
+    if first_read and last_read:
+        summary_lines.append(f"Reading history (from Date Read): {first_read} → {last_read}")
+    if busiest_year is not None:
+        summary_lines.append(f"Busiest year: {busiest_year} ({busiest_count} books)")
+    if best_streak_range and best_streak > 1:
+        summary_lines.append(f"Longest yearly streak: {best_streak} years ({best_streak_range[0]}–{best_streak_range[1]})")
+
+    return LibraryStats(
+        summary="\n".join(summary_lines),
+        top_authors=_top_n(authors),
+        top_genres=_top_n(genres),
+        top_collections=_top_n(collections),
+        top_formats=_top_n(formats),
+        top_tags=_top_n(tags),
+        yr_books=yr_books,
+        yr_pages=yr_pages,
+        yr_ratings_sum=yr_ratings_sum,
+        yr_ratings_n=yr_ratings_n,
+        yr_added=yr_added,
+        formats=formats,
+        ratings_all=ratings_all,
+        tags=tags,
+    )
+
+
+# ----------------------------
+# Parsed-library cache (pickle)
+# ----------------------------
+
+# Bump when parsing semantics change; Book's slot layout is part of the tag too,
+# so adding/removing fields invalidates old caches automatically.
+_LIBRARY_CACHE_VERSION = (2, Book.__slots__)
+
+
+def _library_cache_path(cache_dir: str, path: str) -> str:
+    digest = hashlib.sha1(os.path.abspath(path).encode("utf-8")).hexdigest()[:16]
+    return os.path.join(cache_dir, f"library-{digest}.pkl")
+
+
+def load_cached_books(cache_dir: str, path: str) -> Optional[List[Book]]:
+    """
+    Return the parsed books for `path` from the pickle cache, or None if there is
+    no cache or it is stale (source mtime/size or cache version changed).
+    """
+    try:
+        st = os.stat(path)
+        with open(_library_cache_path(cache_dir, path), "rb") as f:
+            header = pickle.load(f)
+            if header != (_LIBRARY_CACHE_VERSION, st.st_mtime_ns, st.st_size):
+                return None
+            books = pickle.load(f)
+        return books if isinstance(books, list) else None
+    except Exception:
+        return None
+
+
+def save_cached_books(cache_dir: str, path: str, books: List[Book]) -> None:
+    cache_path = _library_cache_path(cache_dir, path)
+    tmp = cache_path + ".tmp"
+    try:
+        st = os.stat(path)
+        with open(tmp, "wb") as f:
+            pickle.dump((_LIBRARY_CACHE_VERSION, st.st_mtime_ns, st.st_size), f, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(books, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, cache_path)
+    except Exception:
+        # Best-effort; the cache is only a speed-up.
+        try:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+        except Exception:
+            pass
+
+
 # ----------------------------
 # GUI App
 # ----------------------------
 
+def _tree_set_rows(tree: ttk.Treeview, rows: Sequence[Tuple[Any, ...]]) -> None:
+    """
+    Make a flat Treeview show exactly `rows`. Existing rows are reused (values
+    updated in place); only the difference in row count is inserted/deleted.
+    """
+    # Straight Tcl calls skip ttk.Treeview's per-call option formatting
+    call = tree.tk.call
+    w = str(tree)
+    have = tree.get_children()
+    for iid, values in zip(have, rows):
+        call(w, "item", iid, "-values", values)
+    if len(have) > len(rows):
+        tree.delete(*have[len(rows):])
+    for values in rows[len(have):]:
+        call(w, "insert", "", "end", "-values", values)
+
+
 class _TopTable:
     def __init__(self, frame: ttk.Frame, title: str):
         self.frame = ttk.LabelFrame(frame, text=title, padding=8)
@@ -482,6 +1189,15 @@ class BookStatsApp(tk.Tk):
         # Keep PhotoImage references alive (prevents images disappearing)
         self._img_refs: Dict[str, Any] = {}
 
+        # Background cover prefetch (created lazily; see _prefetch_covers)
+        self._cover_prefetch_pool: Optional[ThreadPoolExecutor] = None
+        self._cover_prefetch_inflight: set = set()
+
+        # Statistics aggregation runs off the Tk thread (see refresh_stats); results
+        # stamped with an older token are dropped
+        self._stats_pool: Optional[ThreadPoolExecutor] = None
+        self._stats_token = 0
+
         # Column drag state
         self._col_drag_name: Optional[str] = None
         self._col_drag_start_x: int = 0
@@ -491,8 +1207,47 @@ class BookStatsApp(tk.Tk):
         self.books: List[Book] = []
         self.filtered_books: List[Book] = []
         self.current_path: Optional[str] = None
+        # Parsed copy of the loaded JSON that summary write-backs edit in place; written
+        # out on a debounce (see _schedule_raw_json_write)
+        self._raw_json: Optional[Dict[str, Any]] = None
+        self._raw_json_path: Optional[str] = None
+        self._raw_json_save_after_id: Optional[str] = None
+
+        # Values last pushed into the collections Listbox and the Tag/Media dropdowns;
+        # the refresh methods skip the Tk calls when these are unchanged
+        self._last_collections_key: Tuple[str, ...] = ()
+        self._last_tag_values: Tuple[str, ...] = ("Any",)
+        self._last_media_values: Tuple[str, ...] = ("Any",)
+
+        # Reverse indexes into self.books (see _rebuild_filter_indexes)
+        self._by_tag: Dict[str, List[int]] = {}
+        self._by_format: Dict[str, List[int]] = {}
+        self._by_collection: Dict[str, List[int]] = {}
+        self._by_quick: Dict[str, List[int]] = {}
+        # Tag/format names as written (the Library dropdowns list these)
+        self._tag_names: Set[str] = set()
+        self._format_names: Set[str] = set()
+        # Last search (filter params, query, matches in library order); a query that
+        # extends it only needs to rescan those matches (see apply_filters)
+        self._last_search: Optional[Tuple[Tuple[str, str, str], str, List[Book]]] = None
+        # (query, quick, tag, media, sort col, sort desc) of the last apply_filters run
+        self._last_filter_sig: Optional[Tuple[Any, ...]] = None
+        # Library Treeview: only the rows in view are materialized (see _render_tree_window)
+        self._tree_iid_overrides: Dict[int, str] = {}
+        self._tree_book_by_iid: Dict[str, Book] = {}
+        self._view_iids: List[str] = []          # all rows under the current filter/sort
+        self._view_first: int = 0                # index (into _view_iids) of the top row shown
+        self._view_rows: int = 22                # rows that fit in the widget
+        self._tree_window_iids: List[str] = []   # rows currently inserted in the Treeview
+        self._tree_selected: set = set()         # selection, including rows scrolled out of view
+        self._tree_click_replaces: bool = False  # next <<TreeviewSelect>> comes from a plain click
+        self._tree_anchor: str = ""              # row Shift+click/arrow selections extend from
+
+        # Numeric columns for the stats pass (see build_book_columns)
+        self._columns = BookColumns()
 
         # Sorting state (Library tab)
+        self._sorted_col: Optional[str] = None  # column whose heading shows the arrow
         self.sort_col = "Author"
         self.sort_desc = False
 
@@ -621,7 +1376,10 @@ class BookStatsApp(tk.Tk):
         def do_clear_cover_cache():
             cache_dir = os.path.join(self.cache_dir, "covers")
             try:
-                if os.path.isdir(cache_dir):
+                if self.cover_cache is not None and hasattr(self.cover_cache, "clear"):
+                    # Also drops the cache's in-memory index of what is on disk
+                    self.cover_cache.clear()
+                elif os.path.isdir(cache_dir):
                     for fn in os.listdir(cache_dir):
                         fp = os.path.join(cache_dir, fn)
                         if os.path.isfile(fp):
@@ -678,7 +1436,16 @@ class BookStatsApp(tk.Tk):
                 self.cover_cache = None
                 self.covers_enabled = False
         if (not self.covers_enabled):
-            self.cover_cache = None
+            self._close_cover_cache()
+
+    def _close_cover_cache(self):
+        # Release the cache's HTTP connections and worker threads
+        cache, self.cover_cache = self.cover_cache, None
+        if cache is not None and hasattr(cache, "close"):
+            try:
+                cache.close()
+            except Exception:
+                pass
 
     def _get_displaycolumns(self) -> Tuple[str, ...]:
         if hasattr(self, "tree") and self.tree is not None:
@@ -720,8 +1487,6 @@ class BookStatsApp(tk.Tk):
 
         self.tree.configure(displaycolumns=display)
         self._apply_persisted_column_widths()
-        # Re-populate to reflect displaycolumns order/visibility
-        self._populate_tree(self.filtered_books)
 
 
     def _build_layout(self):
@@ -757,7 +1522,7 @@ class BookStatsApp(tk.Tk):
         self.search_var = tk.StringVar(value="")
         search_entry = ttk.Entry(top, textvariable=self.search_var, width=34)
         search_entry.pack(side="left", padx=(8, 12))
-        search_entry.bind("<KeyRelease>", lambda e: self.apply_filters())
+        search_entry.bind("<KeyRelease>", lambda e: self._schedule_apply_filters())
 
         ttk.Label(top, text="Quick filter:").pack(side="left")
         self.quick_filter_var = tk.StringVar(value="All")
@@ -806,9 +1571,11 @@ class BookStatsApp(tk.Tk):
 
         self.tree = ttk.Treeview(table_frame, columns=self.all_columns, show="headings", height=22)
 
-        vsb = ttk.Scrollbar(table_frame, orient="vertical", command=self.tree.yview)
+        # The vertical scrollbar drives our row window rather than the Treeview itself
+        vsb = ttk.Scrollbar(table_frame, orient="vertical", command=self._on_library_yview)
         hsb = ttk.Scrollbar(table_frame, orient="horizontal", command=self.tree.xview)
-        self.tree.configure(yscrollcommand=vsb.set, xscrollcommand=hsb.set)
+        self.tree.configure(xscrollcommand=hsb.set)
+        self._library_vsb = vsb
 
         # Headings (sorting handled by our header-click handler so we can also support drag-reorder)
         for c in self.all_columns:
@@ -845,6 +1612,15 @@ class BookStatsApp(tk.Tk):
 
         self.tree.bind("<Double-1>", self._on_double_click_book)
 
+        # Virtual scrolling (see _render_tree_window)
+        self.tree.bind("<Configure>", self._on_tree_configure, add="+")
+        self.tree.bind("<<TreeviewSelect>>", self._on_tree_select, add="+")
+        self.tree.bind("<MouseWheel>", self._on_tree_mousewheel)
+        self.tree.bind("<Button-4>", self._on_tree_mousewheel)
+        self.tree.bind("<Button-5>", self._on_tree_mousewheel)
+        for key in ("<Up>", "<Down>", "<Prior>", "<Next>", "<Home>", "<End>"):
+            self.tree.bind(key, self._on_tree_key_nav)
+
         # Header drag-to-reorder + click-to-sort
         self.tree.bind("<ButtonPress-1>", self._on_tree_button_press, add="+")
         self.tree.bind("<B1-Motion>", self._on_tree_mouse_drag, add="+")
@@ -872,8 +1648,12 @@ class BookStatsApp(tk.Tk):
         return displaycols[idx]
 
     def _on_tree_button_press(self, event):
-        # Ignore clicks that aren't on the header
+        # Remembered for _on_tree_any_button_release (column resizes start on a separator)
         region = self.tree.identify_region(event.x, event.y)
+        self._tree_press_region = region
+        # A click without Shift/Ctrl starts a new selection (see _on_tree_select)
+        self._tree_click_replaces = region in ("cell", "tree") and not (event.state & 0x0005)
+        # Ignore clicks that aren't on the header
         if region != "heading":
             self._col_drag_name = None
             return
@@ -918,17 +1698,14 @@ class BookStatsApp(tk.Tk):
             return
 
         # Drag: reorder columns
+        pos = {c: i for i, c in enumerate(displaycols)}
         target = self._identify_display_column(event.x)
-        if not target or target not in displaycols:
+        src_idx = pos.get(col_name, -1)
+        dst_idx = pos.get(target, -1) if target else -1
+        if src_idx < 0 or dst_idx < 0:
             self._reset_col_drag()
             return
 
-        if col_name not in displaycols:
-            self._reset_col_drag()
-            return
-
-        src_idx = displaycols.index(col_name)
-        dst_idx = displaycols.index(target)
         if src_idx == dst_idx:
             self._reset_col_drag()
             return
@@ -943,20 +1720,17 @@ class BookStatsApp(tk.Tk):
         self.tree.configure(displaycolumns=displaycols)
 
         # Persist full order list (include hidden columns after visible ones so they remain known)
-        full_order = list(displaycols)
-        for c in self.all_columns:
-            if c not in full_order:
-                full_order.append(c)
+        full_order = displaycols + [c for c in self.all_columns if c not in pos]
 
         self.settings["library_column_order"] = full_order
         # Keep existing visibility list
         if not (isinstance(self.settings.get("library_visible_columns"), list) and self.settings.get("library_visible_columns")):
             self.settings["library_visible_columns"] = list(displaycols)
 
-        save_settings(self.data_dir, self.settings)
+        self._schedule_save_settings()
 
-        # Re-populate to match new order
-        self._populate_tree(self.filtered_books)
+        # No repopulate needed: row values are keyed by column id, so changing
+        # displaycolumns is purely a view change that Tk re-renders itself.
 
         self._reset_col_drag()
 
@@ -978,11 +1752,8 @@ class BookStatsApp(tk.Tk):
         item = self.tree.selection()
         if not item:
             return
-        tags = self.tree.item(item[0], "tags")
-        if not tags:
-            return
-        books_id = tags[0]
-        b = next((x for x in self.books if x.books_id == books_id), None)
+        # Row iids map straight to their Book (see _populate_tree_initial)
+        b = self._tree_book_by_iid.get(item[0])
         if b:
             self.show_book_details(b)
 
@@ -996,61 +1767,80 @@ class BookStatsApp(tk.Tk):
         self.filtered_books.sort(key=self._sort_key_for(self.sort_col), reverse=self.sort_desc)
         self._populate_tree(self.filtered_books)
 
+        # Only the previously sorted heading and this one change. No command= here:
+        # header clicks already reach us via _on_tree_button_release, and a heading
+        # command would run a second sort on the same click.
+        prev = self._sorted_col
+        if prev and prev != col:
+            self.tree.heading(prev, text=prev)
         arrow = "▼" if self.sort_desc else "▲"
-        for c in self.tree["columns"]:
-            self.tree.heading(c, text=c, command=lambda x=c: self._on_sort_by(x))
-        self.tree.heading(col, text=f"{col} {arrow}", command=lambda x=col: self._on_sort_by(x))
+        self.tree.heading(col, text=f"{col} {arrow}")
+        self._sorted_col = col
+
+    def _schedule_apply_filters(self, delay_ms: int = 150):
+        """Run apply_filters once typing pauses instead of on every keystroke."""
+        after_id = getattr(self, "_filter_after_id", None)
+        if after_id:
+            try:
+                self.after_cancel(after_id)
+            except Exception:
+                pass
+        self._filter_after_id = self.after(delay_ms, self._run_apply_filters)
+
+    def _run_apply_filters(self):
+        self._filter_after_id = None
+        self.apply_filters()
 
     def apply_filters(self):
+        # A direct call supersedes any pending debounced one.
+        after_id = getattr(self, "_filter_after_id", None)
+        if after_id:
+            self._filter_after_id = None
+            try:
+                self.after_cancel(after_id)
+            except Exception:
+                pass
+
         q = self.search_var.get().strip().lower()
         quick = self.quick_filter_var.get()
         tag_sel = self.tag_filter_var.get()
         media_sel = self.media_filter_var.get()
 
-        def matches_quick(b: Book) -> bool:
-            if quick == "All":
-                return True
-            if quick == "Read":
-                return b.is_read
-            if quick == "Unread":
-                return b.is_unread
-            if quick == "To Read":
-                return b.is_to_read
-            if quick == "Owned":
-                return b.is_owned
-            if quick == "Unowned":
-                return not b.is_owned
-            return True
-
-        def matches_tag(b: Book) -> bool:
-            if tag_sel in ("", "Any"):
-                return True
-            return any(t.lower() == tag_sel.lower() for t in b.tags)
-
-        def matches_media(b: Book) -> bool:
-            if media_sel in ("", "Any"):
-                return True
-            return any(f.lower() == media_sel.lower() for f in b.formats)
-
-        def matches_query(b: Book) -> bool:
-            if not q:
-                return True
-            hay = " | ".join([
-                b.title,
-                b.display_author,
-                b.publication,
-                b.collections_str(),
-                b.genre_str(),
-                b.tags_str(),
-                b.formats_str(),
-                " ".join(b.series),
-            ]).lower()
-            return q in hay
-
-        self.filtered_books = [
-            b for b in self.books
-            if matches_quick(b) and matches_tag(b) and matches_media(b) and matches_query(b)
-        ]
+        # Nothing changed since the last run (e.g. a non-editing key in the search box)
+        sig = (q, quick, tag_sel, media_sel, self.sort_col, self.sort_desc)
+        if sig == self._last_filter_sig:
+            return
+        self._last_filter_sig = sig
+
+        params = (quick, tag_sel, media_sel)
+        last = self._last_search
+        if q and last is not None and last[0] == params and last[1] and last[1] in q:
+            # Typing more characters: every match must already have matched the
+            # shorter query, so only those need rescanning.
+            pool = last[2]
+        else:
+            # Narrow by quick/tag/media via the reverse indexes, keeping library order;
+            # only the surviving candidates are scanned for the search text.
+            postings: List[List[int]] = []
+            if quick in self._by_quick:
+                postings.append(self._by_quick[quick])
+            if tag_sel not in ("", "Any"):
+                postings.append(self._by_tag.get(tag_sel.lower(), []))
+            if media_sel not in ("", "Any"):
+                postings.append(self._by_format.get(media_sel.lower(), []))
+            if postings:
+                books = self.books
+                pool = [books[i] for i in _intersect_postings(postings)]
+            else:
+                pool = self.books
+
+        if q:
+            self.filtered_books = [b for b in pool if q in b.search_hay]
+            # Copied before sorting: the narrowing pass above wants library order
+            self._last_search = (params, q, list(self.filtered_books))
+        else:
+            self.filtered_books = list(pool)
+            self._last_search = None
 
         self.filtered_books.sort(key=self._sort_key_for(self.sort_col), reverse=self.sort_desc)
         self._populate_tree(self.filtered_books)
@@ -1062,47 +1852,221 @@ class BookStatsApp(tk.Tk):
 
     def _sort_key_for(self, col: str):
         if col == "Title":
-            return lambda b: (b.title.lower(), b.author_last, b.display_author.lower())
+            return attrgetter("_sort_key_title")
         if col == "Author":
-            return lambda b: (b.author_last, b.display_author.lower(), b.title.lower())
+            return attrgetter("_sort_key_author")
         if col == "Year":
-            return lambda b: (b.year is None, b.year if b.year is not None else 0, b.title.lower())
+            return attrgetter("_sort_key_year")
         if col == "Pages":
-            return lambda b: (b.pages is None, b.pages if b.pages is not None else 0, b.title.lower())
+            return attrgetter("_sort_key_pages")
         if col == "Rating":
-            return lambda b: (b.rating is None, b.rating if b.rating is not None else 0.0, b.title.lower())
+            return attrgetter("_sort_key_rating")
         if col == "Format":
-            return lambda b: (b.primary_format().lower(), b.title.lower())
+            return attrgetter("_sort_key_format")
         if col == "Tags":
-            return lambda b: (b.tags_str().lower(), b.title.lower())
+            return attrgetter("_sort_key_tags")
         if col == "Collections":
-            return lambda b: (b.collections_str().lower(), b.title.lower())
+            return attrgetter("_sort_key_collections")
         if col == "Genres":
-            return lambda b: (b.genre_str().lower(), b.title.lower())
-        return lambda b: (b.author_last, b.title.lower())
+            return attrgetter("_sort_key_genres")
+        return lambda b: (b.author_last, b.title_lower)
+
+    @staticmethod
+    def _tree_row_values(b: Book) -> Tuple[Any, ...]:
+        return (
+            b.title,
+            b.display_author,
+            b.year if b.year is not None else "",
+            b.pages if b.pages is not None else "",
+            "" if b.rating is None else f"{b.rating:g}",
+            b.primary_format(),
+            b.tags_str(),
+            b.collections_str(),
+            b.genre_str(),
+        )
 
-    def _populate_tree(self, books: List[Book]):
-        self.tree.delete(*self.tree.get_children())
+    def _populate_tree_initial(self, books: List[Book]):
+        """
+        Assign each book its Treeview iid (books_id) once per load. Rows are only
+        materialized for the visible window (see _render_tree_window).
+        """
+        iids: List[str] = []
+        overrides: Dict[int, str] = {}
+        by_iid: Dict[str, Book] = {}
         for b in books:
-            year = b.year if b.year is not None else ""
-            pages = b.pages if b.pages is not None else ""
-            rating = "" if b.rating is None else f"{b.rating:g}"
-            vals = (
-                b.title,
-                b.display_author,
-                year,
-                pages,
-                rating,
-                b.primary_format(),
-                b.tags_str(),
-                b.collections_str(),
-                b.genre_str(),
-            )
-            self.tree.insert("", "end", values=vals, tags=(b.books_id,))
+            iid = b.books_id
+            if not iid or iid in by_iid:
+                # Defensive: duplicate/empty ids in a hand-edited export
+                iid = f"{b.books_id}#{len(iids)}"
+                overrides[id(b)] = iid
+            by_iid[iid] = b
+            iids.append(iid)
+        self._tree_iid_overrides = overrides
+        self._tree_book_by_iid = by_iid
+        self._tree_selected = set()
+        self._view_first = 0
+        # Drop rows from the previous load; a reloaded file reuses the same iids.
+        if self._tree_window_iids:
+            self.tree.delete(*self._tree_window_iids)
+        self._tree_window_iids = []
+        self._view_iids = []
+
+    def _populate_tree(self, books: List[Book]):
+        # Show exactly these rows, in this order; only the visible slice is inserted.
+        overrides = self._tree_iid_overrides
+        if overrides:
+            iids = [overrides.get(id(b), b.books_id) for b in books]
+        else:
+            iids = [b.books_id for b in books]
+        # Same rows in the same order (e.g. a filter that matched the same books): keep the view.
+        if iids != self._view_iids:
+            # New result set: start at the top with nothing selected
+            self._view_iids = iids
+            self._view_first = 0
+            self._tree_selected = set()
+            self._tree_anchor = ""
+            self._render_tree_window()
+            self._on_tree_configure()
 
         # Reset selected-count footer after repopulating
         self._update_library_footer()
 
+    def _render_tree_window(self):
+        """
+        Make the Treeview hold exactly _view_iids[first:first + rows]. Rows that
+        stay in view are kept; only rows scrolling in/out are inserted/deleted.
+        """
+        tree = self.tree
+        total = len(self._view_iids)
+        rows = max(1, self._view_rows)
+        first = max(0, min(self._view_first, total - rows))
+        self._view_first = first
+        want = self._view_iids[first:first + rows]
+
+        have = self._tree_window_iids
+        if want != have:
+            want_set = set(want)
+            gone = [iid for iid in have if iid not in want_set]
+            if gone:
+                tree.delete(*gone)
+            have_set = set(have)
+            call = tree.tk.call
+            w = str(tree)
+            row_values = self._tree_row_values
+            by_iid = self._tree_book_by_iid
+            for iid in want:
+                if iid not in have_set:
+                    b = by_iid[iid]
+                    call(w, "insert", "", "end", "-id", iid, "-values", row_values(b), "-tags", (b.books_id,))
+            tree.set_children("", *want)
+            self._tree_window_iids = want
+
+            sel = [iid for iid in want if iid in self._tree_selected]
+            tree.selection_set(sel)
+        tree.yview_moveto(0)
+
+        if total:
+            self._library_vsb.set(first / total, min(1.0, (first + rows) / total))
+        else:
+            self._library_vsb.set(0.0, 1.0)
+
+    def _scroll_tree_to(self, first: int):
+        if first != self._view_first:
+            self._view_first = first
+            self._render_tree_window()
+
+    def _on_library_yview(self, *args):
+        total = len(self._view_iids)
+        if not total or not args:
+            return
+        if args[0] == "moveto":
+            self._view_first = max(0, int(float(args[1]) * total + 0.5))
+        elif args[0] == "scroll":
+            step = int(args[1]) * (max(1, self._view_rows) if args[2] == "pages" else 1)
+            self._view_first = max(0, self._view_first + step)
+        # Always re-render so the scrollbar thumb snaps back to the clamped window.
+        self._render_tree_window()
+
+    def _on_tree_mousewheel(self, event):
+        if event.num == 4:
+            step = -3
+        elif event.num == 5:
+            step = 3
+        elif sys.platform == "darwin":
+            step = -event.delta
+        else:
+            step = -3 * int(event.delta / 120)
+        if step:
+            self._scroll_tree_to(max(0, self._view_first + step))
+        return "break"
+
+    def _on_tree_key_nav(self, event):
+        total = len(self._view_iids)
+        if not total:
+            return "break"
+        rows = max(1, self._view_rows)
+        focus = self.tree.focus()
+        try:
+            idx = self._view_first + self._tree_window_iids.index(focus)
+        except ValueError:
+            idx = self._view_first
+        step = {"Up": -1, "Down": 1, "Prior": -rows, "Next": rows, "Home": -total, "End": total}.get(event.keysym, 0)
+        idx = max(0, min(total - 1, idx + step))
+
+        iid = self._view_iids[idx]
+        if event.state & 0x0001:
+            # Shift: select everything between the anchor row and the new one
+            if not self._tree_anchor:
+                self._tree_anchor = focus or iid
+            try:
+                a = self._view_iids.index(self._tree_anchor)
+            except ValueError:
+                a = idx
+            lo, hi = min(a, idx), max(a, idx)
+            self._tree_selected = set(self._view_iids[lo:hi + 1])
+        else:
+            self._tree_anchor = iid
+            self._tree_selected = {iid}
+
+        first = self._view_first
+        if idx < first:
+            first = idx
+        elif idx >= first + rows:
+            first = idx - rows + 1
+        self._scroll_tree_to(first)
+
+        self.tree.selection_set([i for i in self._tree_window_iids if i in self._tree_selected])
+        self.tree.focus(iid)
+        return "break"
+
+    def _on_tree_configure(self, _event=None):
+        # Re-measure how many rows fit (row height comes from the first row's bbox).
+        tree = self.tree
+        rows = self._view_rows
+        if self._tree_window_iids:
+            bb = tree.bbox(self._tree_window_iids[0])
+            if bb and bb[3] > 0:
+                rows = max(1, (tree.winfo_height() - bb[1]) // bb[3])
+        if rows != self._view_rows:
+            self._view_rows = rows
+            self._render_tree_window()
+
+    def _on_tree_select(self, _event=None):
+        selected = set(self.tree.selection())
+        if self._tree_click_replaces:
+            # Plain click: drops rows selected earlier, including scrolled-out ones
+            self._tree_click_replaces = False
+            self._tree_selected = selected
+            self._tree_anchor = self.tree.focus()
+            return
+        # Fold the visible selection into the persistent one.
+        keep = self._tree_selected
+        for iid in self._tree_window_iids:
+            if iid in selected:
+                keep.add(iid)
+            else:
+                keep.discard(iid)
+
     def _update_library_footer(self):
         """Update the Library-tab footer showing how many rows are shown under current filters."""
         if not hasattr(self, "library_footer_var"):
@@ -1156,31 +2120,37 @@ class BookStatsApp(tk.Tk):
             self.settings["library_column_widths"] = self._get_current_column_widths()
             save_settings(self.data_dir, self.settings)
 
+    def _schedule_save_settings(self, delay_ms: int = 500):
+        """Coalesce bursts of settings changes into a single disk write."""
+        after_id = getattr(self, "_settings_save_after_id", None)
+        if after_id:
+            try:
+                self.after_cancel(after_id)
+            except Exception:
+                pass
+        self._settings_save_after_id = self.after(delay_ms, self._flush_settings)
+
+    def _flush_settings(self):
+        self._settings_save_after_id = None
+        save_settings(self.data_dir, self.settings)
+
     def _on_tree_any_button_release(self, _event):
         """Catch column resize events and persist widths with a small debounce."""
         if not hasattr(self, "tree") or self.tree is None:
             return
+        # Only a press on a column separator can have resized anything. The press
+        # region is used because the pointer may be released anywhere after a drag.
+        if getattr(self, "_tree_press_region", None) != "separator":
+            return
         new_widths = self._get_current_column_widths()
         last = getattr(self, "_last_saved_widths", None)
         if last == new_widths:
             return
         self._last_saved_widths = dict(new_widths)
 
-        # Update settings in memory
+        # Update settings in memory; disk write is debounced
         self.settings["library_column_widths"] = dict(new_widths)
-
-        # Debounce disk writes
-        after_id = getattr(self, "_width_save_after_id", None)
-        if after_id:
-            try:
-                self.after_cancel(after_id)
-            except Exception:
-                pass
-
-        def commit():
-            save_settings(self.data_dir, self.settings)
-
-        self._width_save_after_id = self.after(600, commit)
+        self._schedule_save_settings()
 
 
     # ----------------------------
@@ -1243,39 +2213,45 @@ class BookStatsApp(tk.Tk):
         self._random_last_pool_size: Optional[int] = None
         self.random_result.configure(state="disabled")
 
-    def _selected_collections(self) -> List[str]:
-        sel = self.collections_list.curselection()
-        items = [self.collections_list.get(i) for i in sel]
-        return items
+    def _selected_collections(self) -> Set[str]:
+        get = self.collections_list.get
+        return {get(i) for i in self.collections_list.curselection()}
 
     def _random_pool(self) -> List[Book]:
         if not self.books:
             return []
 
-        selected = set(self._selected_collections())
+        postings: List[List[int]] = []
+        selected = self._selected_collections()
         if selected:
-            pool = [b for b in self.books if any(c in selected for c in b.collections)]
-        else:
-            pool = list(self.books)
+            idx = set()
+            for c in selected:
+                idx.update(self._by_collection.get(c, ()))
+            postings.append(sorted(idx))
 
         status = self.rp_status_var.get()
-        if status == "Read":
-            pool = [b for b in pool if b.is_read]
-        elif status == "Unread":
-            pool = [b for b in pool if b.is_unread]
+        if status in ("Read", "Unread"):
+            postings.append(self._by_quick.get(status, []))
 
         if self.rp_owned_only.get():
-            pool = [b for b in pool if b.is_owned]
+            postings.append(self._by_quick.get("Owned", []))
 
-        min_rating = float(self.rp_min_rating.get())
-        if min_rating > 0:
-            pool = [b for b in pool if (b.rating is not None and b.rating >= min_rating)]
+        if postings:
+            books = self.books
+            candidates = [books[i] for i in _intersect_postings(postings)]
+        else:
+            candidates = self.books
 
+        # Remaining per-book checks in one pass
+        min_rating = float(self.rp_min_rating.get())
         genre_q = self.rp_genre_var.get().strip().lower()
-        if genre_q:
-            pool = [b for b in pool if genre_q in b.genre_str().lower()]
-
-        return pool
+        if min_rating <= 0 and not genre_q:
+            return list(candidates)
+        return [
+            b for b in candidates
+            if (min_rating <= 0 or (b.rating is not None and b.rating >= min_rating))
+            and (not genre_q or genre_q in b._genre_str_lower)
+        ]
 
     def pick_random(self):
         pool = self._random_pool()
@@ -1357,96 +2333,121 @@ class BookStatsApp(tk.Tk):
         grids.rowconfigure(0, weight=1)
         grids.rowconfigure(1, weight=1)
 
-        # --- Trends ---
+        # --- Trends / Distributions ---
+        # Charts are built the first time either tab is shown (see _build_stats_charts),
+        # and each tab is only redrawn while visible and stale (see _draw_visible_charts).
+        self._charts_built = False
+        self._chart_inputs: Optional[LibraryStats] = None
+        self._charts_dirty = {"trends": False, "dist": False}
+        # chart name -> (x positions/labels, bar artists) currently shown; ((), None)
+        # while it shows its no-data title (see _show_bars)
+        self._chart_bars: Dict[str, Tuple[Tuple[Any, ...], Any]] = {}
+        # chart name -> its FigureCanvasTkAgg (several charts share one), and the
+        # canvases waiting for a redraw -> whether they also need tight_layout
+        self._chart_canvas: Dict[str, Any] = {}
+        self._chart_redraws: Dict[Any, bool] = {}
         if _HAS_MPL:
-            trends_grid = ttk.Frame(self.stats_trends)
-            trends_grid.pack(fill="both", expand=True)
-
-            self._fig_reads = Figure(figsize=(5, 3), dpi=100)
-            self._ax_reads = self._fig_reads.add_subplot(111)
-            self._canvas_reads = FigureCanvasTkAgg(self._fig_reads, master=trends_grid)
-            self._canvas_reads.get_tk_widget().grid(row=0, column=0, sticky="nsew", padx=(0, 10), pady=(0, 10))
-
-            self._fig_pages = Figure(figsize=(5, 3), dpi=100)
-            self._ax_pages = self._fig_pages.add_subplot(111)
-            self._canvas_pages = FigureCanvasTkAgg(self._fig_pages, master=trends_grid)
-            self._canvas_pages.get_tk_widget().grid(row=0, column=1, sticky="nsew", pady=(0, 10))
-
-            self._fig_added = Figure(figsize=(5, 3), dpi=100)
-            self._ax_added = self._fig_added.add_subplot(111)
-            self._canvas_added = FigureCanvasTkAgg(self._fig_added, master=trends_grid)
-            self._canvas_added.get_tk_widget().grid(row=1, column=0, sticky="nsew", padx=(0, 10))
-
-            year_table_frame = ttk.LabelFrame(trends_grid, text="Reads by year", padding=8)
-            year_table_frame.grid(row=1, column=1, sticky="nsew")
-
-            self.year_tree = ttk.Treeview(
-                year_table_frame,
-                columns=("Year", "Books Read", "Pages Read", "Avg Rating"),
-                show="headings",
-                height=10
-            )
-            for c, w, a in [
-                ("Year", 60, "e"),
-                ("Books Read", 90, "e"),
-                ("Pages Read", 90, "e"),
-                ("Avg Rating", 90, "e"),
-            ]:
-                self.year_tree.heading(c, text=c)
-                self.year_tree.column(c, width=w, anchor=a)
-            self.year_tree.pack(fill="both", expand=True)
-
-            trends_grid.columnconfigure(0, weight=1)
-            trends_grid.columnconfigure(1, weight=1)
-            trends_grid.rowconfigure(0, weight=1)
-            trends_grid.rowconfigure(1, weight=1)
+            self.stats_nb.bind("<<NotebookTabChanged>>", self._on_stats_subtab_changed)
+            self.notebook.bind("<<NotebookTabChanged>>", self._on_stats_subtab_changed, add="+")
         else:
+            self._show_charts_unavailable()
+
+    def _show_charts_unavailable(self):
+        for frame in (self.stats_trends, self.stats_dist):
             ttk.Label(
-                self.stats_trends,
+                frame,
                 text="Matplotlib not available — install it to see charts (pip install matplotlib)."
             ).pack(anchor="w")
 
-        # --- Distributions ---
-        if _HAS_MPL:
-            dist_grid = ttk.Frame(self.stats_dist)
-            dist_grid.pack(fill="both", expand=True)
-
-            self._fig_format = Figure(figsize=(5, 3), dpi=100)
-            self._ax_format = self._fig_format.add_subplot(111)
-            self._canvas_format = FigureCanvasTkAgg(self._fig_format, master=dist_grid)
-            self._canvas_format.get_tk_widget().grid(row=0, column=0, sticky="nsew", padx=(0, 10), pady=(0, 10))
-
-            self._fig_rating = Figure(figsize=(5, 3), dpi=100)
-            self._ax_rating = self._fig_rating.add_subplot(111)
-            self._canvas_rating = FigureCanvasTkAgg(self._fig_rating, master=dist_grid)
-            self._canvas_rating.get_tk_widget().grid(row=0, column=1, sticky="nsew", pady=(0, 10))
-
-            self._fig_tags = Figure(figsize=(5, 3), dpi=100)
-            self._ax_tags = self._fig_tags.add_subplot(111)
-            self._canvas_tags = FigureCanvasTkAgg(self._fig_tags, master=dist_grid)
-            self._canvas_tags.get_tk_widget().grid(row=1, column=0, sticky="nsew", padx=(0, 10))
-
-            self._fig_len = Figure(figsize=(5, 3), dpi=100)
-            self._ax_len = self._fig_len.add_subplot(111)
-            self._canvas_len = FigureCanvasTkAgg(self._fig_len, master=dist_grid)
-            self._canvas_len.get_tk_widget().grid(row=1, column=1, sticky="nsew")
-
-            dist_grid.columnconfigure(0, weight=1)
-            dist_grid.columnconfigure(1, weight=1)
-            dist_grid.rowconfigure(0, weight=1)
-            dist_grid.rowconfigure(1, weight=1)
+    def _visible_chart_tab(self) -> Optional[str]:
+        if self.notebook.select() != str(self.tab_stats):
+            return None
+        sub = self.stats_nb.select()
+        if sub == str(self.stats_trends):
+            return "trends"
+        if sub == str(self.stats_dist):
+            return "dist"
+        return None
+
+    def _on_stats_subtab_changed(self, _event=None):
+        if not _HAS_MPL or self._visible_chart_tab() is None:
+            return
+        if not self._charts_built:
+            self._build_stats_charts()
         else:
-            ttk.Label(
-                self.stats_dist,
-                text="Matplotlib not available — install it to see charts (pip install matplotlib)."
-            ).pack(anchor="w")
+            self._draw_visible_charts()
+
+    def _build_stats_charts(self):
+        if not _ensure_mpl():
+            self._show_charts_unavailable()
+            return
+
+        # --- Trends ---
+        trends_grid = ttk.Frame(self.stats_trends)
+        trends_grid.pack(fill="both", expand=True)
+
+        # Reads + pages share one figure (top row); the added chart sits beside the year table.
+        fig_top = Figure(figsize=(10, 3), dpi=100)
+        self._ax_reads, self._ax_pages = fig_top.subplots(1, 2)
+        canvas_top = FigureCanvasTkAgg(fig_top, master=trends_grid)
+        canvas_top.get_tk_widget().grid(row=0, column=0, columnspan=2, sticky="nsew", pady=(0, 10))
+
+        fig_added = Figure(figsize=(5, 3), dpi=100)
+        self._ax_added = fig_added.add_subplot(111)
+        canvas_added = FigureCanvasTkAgg(fig_added, master=trends_grid)
+        canvas_added.get_tk_widget().grid(row=1, column=0, sticky="nsew", padx=(0, 10))
+
+        year_table_frame = ttk.LabelFrame(trends_grid, text="Reads by year", padding=8)
+        year_table_frame.grid(row=1, column=1, sticky="nsew")
+
+        self.year_tree = ttk.Treeview(
+            year_table_frame,
+            columns=("Year", "Books Read", "Pages Read", "Avg Rating"),
+            show="headings",
+            height=10
+        )
+        for c, w, a in [
+            ("Year", 60, "e"),
+            ("Books Read", 90, "e"),
+            ("Pages Read", 90, "e"),
+            ("Avg Rating", 90, "e"),
+        ]:
+            self.year_tree.heading(c, text=c)
+            self.year_tree.column(c, width=w, anchor=a)
+        self.year_tree.pack(fill="both", expand=True)
+
+        trends_grid.columnconfigure(0, weight=1)
+        trends_grid.columnconfigure(1, weight=1)
+        trends_grid.rowconfigure(0, weight=1)
+        trends_grid.rowconfigure(1, weight=1)
+
+        # --- Distributions ---
+        dist_grid = ttk.Frame(self.stats_dist)
+        dist_grid.pack(fill="both", expand=True)
+
+        # All four distribution charts live on one 2x2 figure / canvas.
+        fig_dist = Figure(figsize=(10, 6), dpi=100)
+        (self._ax_format, self._ax_rating), (self._ax_tags, self._ax_len) = fig_dist.subplots(2, 2)
+        canvas_dist = FigureCanvasTkAgg(fig_dist, master=dist_grid)
+        canvas_dist.get_tk_widget().pack(fill="both", expand=True)
+
+        self._chart_canvas = {
+            "reads": canvas_top,
+            "pages": canvas_top,
+            "added": canvas_added,
+            "format": canvas_dist,
+            "rating": canvas_dist,
+            "tags": canvas_dist,
+            "len": canvas_dist,
+        }
+        self._charts_built = True
+        self._draw_visible_charts()
 
     def _fill_top_table(self, tree: ttk.Treeview, rows: List[Tuple[str, int]]):
-        tree.delete(*tree.get_children())
-        for item, count in rows:
-            tree.insert("", "end", values=(item, f"{count:,}"))
+        _tree_set_rows(tree, [(item, f"{count:,}") for item, count in rows])
 
     def refresh_stats(self):
+        self._stats_token += 1
         if not self.books:
             self._set_stats_summary("No data loaded.")
             self._fill_top_table(self.top_authors.tree, [])
@@ -1455,147 +2456,68 @@ class BookStatsApp(tk.Tk):
             self._fill_top_table(self.top_formats.tree, [])
             self._fill_top_table(self.top_tags.tree, [])
             if hasattr(self, "overview_year_tree"):
-                self.overview_year_tree.delete(*self.overview_year_tree.get_children())
-            if _HAS_MPL:
+                _tree_set_rows(self.overview_year_tree, [])
+            self._chart_inputs = None
+            self._charts_dirty = {"trends": False, "dist": False}
+            if self._charts_built:
                 self._clear_axes()
             return
 
-        total = len(self.books)
-        read = sum(1 for b in self.books if b.is_read)
-        unread = sum(1 for b in self.books if b.is_unread)
-        to_read = sum(1 for b in self.books if b.is_to_read)
-        owned = sum(1 for b in self.books if b.is_owned)
-        unowned = total - owned
-
-        ratings_all = [b.rating for b in self.books if b.rating is not None]
-        avg_rating_all = (sum(ratings_all) / len(ratings_all)) if ratings_all else None
-
-        ratings_read = [b.rating for b in self.books if b.is_read and b.rating is not None]
-        avg_rating_read = (sum(ratings_read) / len(ratings_read)) if ratings_read else None
+        token = self._stats_token
+        if self._stats_pool is None:
+            self._stats_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="stats")
+        # The pool reads these references only; a new load replaces (never mutates) them.
+        fut = self._stats_pool.submit(compute_library_stats, self.books, self._columns, self._by_quick)
 
-        pages_total = sum(b.pages for b in self.books if b.pages is not None)
-        pages_read = sum(b.pages for b in self.books if b.is_read and b.pages is not None)
-
-        authors = Counter()
-        genres = Counter()
-        collections = Counter()
-        formats = Counter()
-        tags = Counter()
-
-        for b in self.books:
-            if b.display_author:
-                authors[b.display_author] += 1
-            for g in b.genre:
-                genres[g] += 1
-            for c in b.collections:
-                collections[c] += 1
-            if b.primary_format():
-                formats[b.primary_format()] += 1
-            for t in b.tags:
-                tags[t] += 1
-
-        unique_authors = len({b.display_author for b in self.books if b.display_author})
-        unique_collections = len(collections)
-        unique_formats = len(formats)
-
-        # Reading timeline
-        read_dates = [d for d in (_parse_date_yyyy_mm_dd(b.dateread) for b in self.books if b.is_read) if d is not None]
-        first_read = min(read_dates).date().isoformat() if read_dates else None
-        last_read = max(read_dates).date().isoformat() if read_dates else None
-
-        # Yearly stats
-        yr_books = Counter()
-        yr_pages = Counter()
-        yr_ratings_sum = defaultdict(float)
-        yr_ratings_n = Counter()
-
-        for b in self.books:
-            if not b.is_read:
-                continue
-            d = _parse_date_yyyy_mm_dd(b.dateread)
-            if not d:
-                continue
-            y = d.year
-            yr_books[y] += 1
-            if b.pages is not None:
-                yr_pages[y] += b.pages
-            if b.rating is not None:
-                yr_ratings_sum[y] += b.rating
-                yr_ratings_n[y] += 1
-
-        busiest_year = None
-        if yr_books:
-            busiest_year, busiest_count = max(yr_books.items(), key=lambda kv: kv[1])
-        else:
-            busiest_count = 0
-
-        # Reading streak (consecutive years with >=1 read)
-        best_streak = 0
-        best_streak_range: Optional[Tuple[int, int]] = None
-        if yr_books:
-            years = sorted(yr_books.keys())
-            cur_start = years[0]
-            cur_prev = years[0]
-            cur_len = 1
-            for y in years[1:]:
-                if y == cur_prev + 1:
-                    cur_prev = y
-                    cur_len += 1
-                else:
-                    if cur_len > best_streak:
-                        best_streak = cur_len
-                        best_streak_range = (cur_start, cur_prev)
-                    cur_start = y
-                    cur_prev = y
-                    cur_len = 1
-            if cur_len > best_streak:
-                best_streak = cur_len
-                best_streak_range = (cur_start, cur_prev)
-
-        summary_lines = [
-            f"Total books: {total:,}",
-            f"Owned: {owned:,}   |   Unowned: {unowned:,}",
-            f"Read: {read:,}   |   Unread: {unread:,}   |   To Read (Owned+Unread): {to_read:,}",
-            f"Unique authors: {unique_authors:,}",
-            f"Unique collections: {unique_collections:,}",
-            f"Unique formats: {unique_formats:,}",
-            f"Total pages (where known): {pages_total:,}",
-            f"Pages read (where known): {pages_read:,}",
-        ]
-
-        if avg_rating_all is None:
-            summary_lines.append("Average rating (rated only): (no ratings found)")
-        else:
-            summary_lines.append(f"Average rating (rated only): {avg_rating_all:.2f}  (n={len(ratings_all):,})")
+        def on_done(_f):
+            try:
+                self.after(0, self._apply_stats, token, fut)
+            except Exception:
+                pass  # window already gone
 
-        if avg_rating_read is not None:
-            summary_lines.append(f"Average rating (read + rated): {avg_rating_read:.2f}  (n={len(ratings_read):,})")
+        fut.add_done_callback(on_done)
 
-        if first_read and last_read:
-            summary_lines.append(f"Reading history (from Date Read): {first_read} → {last_read}")
-        if busiest_year is not None:
-            summary_lines.append(f"Busiest year: {busiest_year} ({busiest_count} books)")
-        if best_streak_range and best_streak > 1:
-            summary_lines.append(f"Longest yearly streak: {best_streak} years ({best_streak_range[0]}–{best_streak_range[1]})")
+    def _apply_stats(self, token: int, fut: Any):
+        if token != self._stats_token:
+            return  # a newer refresh_stats superseded this one
+        try:
+            st: LibraryStats = fut.result()
+        except Exception as e:
+            self._set_stats_summary(f"Could not compute statistics:\n{e}")
+            return
 
-        self._set_stats_summary("\n".join(summary_lines))
+        self._set_stats_summary(st.summary)
 
-        self._fill_top_table(self.top_authors.tree, authors.most_common(20))
-        self._fill_top_table(self.top_genres.tree, genres.most_common(20))
-        self._fill_top_table(self.top_collections.tree, collections.most_common(20))
-        self._fill_top_table(self.top_formats.tree, formats.most_common(20))
-        self._fill_top_table(self.top_tags.tree, tags.most_common(20))
+        self._fill_top_table(self.top_authors.tree, st.top_authors)
+        self._fill_top_table(self.top_genres.tree, st.top_genres)
+        self._fill_top_table(self.top_collections.tree, st.top_collections)
+        self._fill_top_table(self.top_formats.tree, st.top_formats)
+        self._fill_top_table(self.top_tags.tree, st.top_tags)
 
         # Populate the overview "Books read by year" table (most recent first)
         if hasattr(self, "overview_year_tree"):
-            self.overview_year_tree.delete(*self.overview_year_tree.get_children())
-            for y in sorted(yr_books.keys(), reverse=True):
-                self.overview_year_tree.insert("", "end", values=(y, f"{yr_books[y]:,}"))
+            _tree_set_rows(self.overview_year_tree,
+                           [(y, f"{st.yr_books[y]:,}") for y in sorted(st.yr_books.keys(), reverse=True)])
 
-        if _HAS_MPL:
-            self._update_trends_charts(yr_books, yr_pages)
-            self._update_distributions_charts(formats, ratings_all, tags)
-            self._update_added_chart()
+        self._chart_inputs = st
+        self._charts_dirty = {"trends": True, "dist": True}
+        self._draw_visible_charts()
+
+    def _draw_visible_charts(self):
+        # Only the chart tab on screen is redrawn; the other stays dirty until it is selected.
+        if not self._charts_built or self._chart_inputs is None:
+            return
+        tab = self._visible_chart_tab()
+        if tab is None or not self._charts_dirty.get(tab):
+            return
+        st = self._chart_inputs
+        if tab == "trends":
+            self._update_trends_charts(st.yr_books, st.yr_pages, st.yr_ratings_sum, st.yr_ratings_n)
+            self._update_added_chart(st.yr_added)
+        else:
+            self._update_distributions_charts(st.formats, st.ratings_all, st.tags)
+        self._flush_chart_redraws()
+        self._charts_dirty[tab] = False
 
     def _set_stats_summary(self, s: str):
         self.stats_summary.configure(state="normal")
@@ -1604,153 +2526,151 @@ class BookStatsApp(tk.Tk):
         self.stats_summary.configure(state="disabled")
 
     def _clear_axes(self):
+        self._chart_bars.clear()
         # trends
         for ax in [getattr(self, "_ax_reads", None), getattr(self, "_ax_pages", None), getattr(self, "_ax_added", None),
                    getattr(self, "_ax_format", None), getattr(self, "_ax_rating", None), getattr(self, "_ax_tags", None),
                    getattr(self, "_ax_len", None)]:
             if ax is not None:
                 ax.clear()
-        for canvas in [getattr(self, "_canvas_reads", None), getattr(self, "_canvas_pages", None), getattr(self, "_canvas_added", None),
-                       getattr(self, "_canvas_format", None), getattr(self, "_canvas_rating", None), getattr(self, "_canvas_tags", None),
-                       getattr(self, "_canvas_len", None)]:
-            if canvas is not None:
-                canvas.draw_idle()
+        self._chart_redraws = {}
+        for canvas in set(self._chart_canvas.values()):
+            canvas.draw_idle()
 
         if hasattr(self, "year_tree"):
-            self.year_tree.delete(*self.year_tree.get_children())
+            _tree_set_rows(self.year_tree, [])
 
-    def _update_trends_charts(self, yr_books: Counter, yr_pages: Counter):
-        # Books read per year
-        self._ax_reads.clear()
-        if yr_books:
-            years = sorted(yr_books.keys())
-            vals = [yr_books[y] for y in years]
-            self._ax_reads.bar(years, vals)
-            self._ax_reads.set_title("Books read per year")
-            self._ax_reads.set_xlabel("Year")
-            self._ax_reads.set_ylabel("Books")
+    def _show_bars(self, name: str, xkey: Tuple[Any, ...], heights: Sequence[float],
+                   draw: Callable[[Any], Any], title: str, empty_title: str,
+                   xlabel: str = "", ylabel: str = "", ticklabels: Optional[List[str]] = None):
+        """
+        Show bars on chart `name`, touching as little of its axes as possible:
+          - same x positions/labels as last time: resize the bars in place;
+          - other x values while bars are shown: swap only the bar artists
+            (title, axis labels, spines and tickers stay);
+          - first draw, or no data (empty xkey): clear() and rebuild the axes.
+        `draw(ax)` creates and returns the bars.
+        """
+        ax = getattr(self, "_ax_" + name)
+        prev = self._chart_bars.get(name)
+        relayout = True
+        if prev is not None and prev[0] == xkey:
+            if not xkey:
+                return  # still showing the no-data title
+            for bar, h in zip(prev[1], heights):
+                bar.set_height(h)
+            relayout = False
+        elif prev is not None and prev[1] is not None and xkey:
+            prev[1].remove()
+            self._chart_bars[name] = (xkey, draw(ax))
+        elif xkey:
+            ax.clear()
+            self._chart_bars[name] = (xkey, draw(ax))
+            ax.set_title(title)
+            if xlabel:
+                ax.set_xlabel(xlabel)
+            if ylabel:
+                ax.set_ylabel(ylabel)
         else:
-            self._ax_reads.set_title("Books read per year (no Date Read data)")
-        self._fig_reads.tight_layout()
-        self._canvas_reads.draw_idle()
+            self._chart_bars[name] = ((), None)
+            ax.clear()
+            ax.set_title(empty_title)
+        if relayout and xkey and ticklabels is not None:
+            ax.set_xticks(range(len(ticklabels)))
+            ax.set_xticklabels(ticklabels, rotation=30, ha="right")
+        ax.relim()
+        ax.autoscale_view()
+        self._mark_chart_redraw(name, relayout=relayout)
+
+    def _mark_chart_redraw(self, name: str, relayout: bool = False):
+        # Charts share canvases, so redraws (and tight_layout) are collected per canvas
+        # and done once in _flush_chart_redraws.
+        canvas = self._chart_canvas[name]
+        self._chart_redraws[canvas] = self._chart_redraws.get(canvas, False) or relayout
+
+    def _flush_chart_redraws(self):
+        pending, self._chart_redraws = self._chart_redraws, {}
+        for canvas, relayout in pending.items():
+            if relayout:
+                canvas.figure.tight_layout()
+            canvas.draw_idle()
+
+    def _update_trends_charts(self, yr_books: Counter, yr_pages: Counter,
+                              yr_ratings_sum: Dict[int, float], yr_ratings_n: Counter):
+        # Books read per year
+        years = sorted(yr_books.keys())
+        vals = [yr_books[y] for y in years]
+        self._show_bars("reads", tuple(years), vals, lambda ax: ax.bar(years, vals),
+                        "Books read per year", "Books read per year (no Date Read data)",
+                        xlabel="Year", ylabel="Books")
 
         # Pages read per year
-        self._ax_pages.clear()
-        if yr_pages:
-            years = sorted(yr_pages.keys())
-            vals = [yr_pages[y] for y in years]
-            self._ax_pages.bar(years, vals)
-            self._ax_pages.set_title("Pages read per year (known pages only)")
-            self._ax_pages.set_xlabel("Year")
-            self._ax_pages.set_ylabel("Pages")
-        else:
-            self._ax_pages.set_title("Pages read per year (no pages+Date Read data)")
-        self._fig_pages.tight_layout()
-        self._canvas_pages.draw_idle()
+        p_years = sorted(yr_pages.keys())
+        p_vals = [yr_pages[y] for y in p_years]
+        self._show_bars("pages", tuple(p_years), p_vals, lambda ax: ax.bar(p_years, p_vals),
+                        "Pages read per year (known pages only)", "Pages read per year (no pages+Date Read data)",
+                        xlabel="Year", ylabel="Pages")
 
         # Year table
         if hasattr(self, "year_tree"):
-            self.year_tree.delete(*self.year_tree.get_children())
-            years = sorted(yr_books.keys()) if yr_books else []
+            rows = []
             for y in years:
                 books = yr_books.get(y, 0)
                 pages = yr_pages.get(y, 0)
-                # Avg rating per year (read + rated)
-                r_sum = 0.0
-                r_n = 0
-                for b in self.books:
-                    if not b.is_read or b.rating is None:
-                        continue
-                    d = _parse_date_yyyy_mm_dd(b.dateread)
-                    if d and d.year == y:
-                        r_sum += b.rating
-                        r_n += 1
-                avg = (r_sum / r_n) if r_n else None
-                self.year_tree.insert("", "end", values=(y, books, f"{pages:,}" if pages else "", f"{avg:.2f}" if avg is not None else ""))
-
-    def _update_added_chart(self):
-        # Books added per year (from entrydate)
-        self._ax_added.clear()
-        yr_added = Counter()
-        for b in self.books:
-            d = _parse_date_yyyy_mm_dd(b.entrydate)
-            if d:
-                yr_added[d.year] += 1
-        if yr_added:
-            years = sorted(yr_added.keys())
-            vals = [yr_added[y] for y in years]
-            self._ax_added.bar(years, vals)
-            self._ax_added.set_title("Books added per year (Entry Date)")
-            self._ax_added.set_xlabel("Year")
-            self._ax_added.set_ylabel("Books")
-        else:
-            self._ax_added.set_title("Books added per year (no Entry Date data)")
-        self._fig_added.tight_layout()
-        self._canvas_added.draw_idle()
+                # Avg rating per year (read + rated), accumulated in refresh_stats
+                r_n = yr_ratings_n.get(y, 0)
+                avg = (yr_ratings_sum[y] / r_n) if r_n else None
+                rows.append((y, books, f"{pages:,}" if pages else "", f"{avg:.2f}" if avg is not None else ""))
+            _tree_set_rows(self.year_tree, rows)
+
+    def _update_added_chart(self, yr_added: Counter):
+        # Books added per year (from entrydate, counted in refresh_stats)
+        years = sorted(yr_added.keys())
+        vals = [yr_added[y] for y in years]
+        self._show_bars("added", tuple(years), vals, lambda ax: ax.bar(years, vals),
+                        "Books added per year (Entry Date)", "Books added per year (no Entry Date data)",
+                        xlabel="Year", ylabel="Books")
+
+    def _update_distributions_charts(self, formats: Counter, ratings_all: Sequence[float], tags: Counter):
+        # Charts imply numpy (a matplotlib dependency)
+        _ensure_numpy()
 
-    def _update_distributions_charts(self, formats: Counter, ratings_all: List[float], tags: Counter):
         # Format distribution
-        self._ax_format.clear()
-        if formats:
-            items = formats.most_common(10)
-            labels = [i[0] for i in items]
-            vals = [i[1] for i in items]
-            self._ax_format.bar(range(len(labels)), vals)
-            self._ax_format.set_title("Top formats")
-            self._ax_format.set_ylabel("Books")
-            self._ax_format.set_xticks(range(len(labels)))
-            self._ax_format.set_xticklabels(labels, rotation=30, ha="right")
-        else:
-            self._ax_format.set_title("Top formats (no format data)")
-        self._fig_format.tight_layout()
-        self._canvas_format.draw_idle()
-
-        # Rating histogram (all rated)
-        self._ax_rating.clear()
-        if ratings_all:
-            # Histogram bins for half-star steps
-            bins = [x / 2 for x in range(0, 11)]  # 0..5 in 0.5
-            self._ax_rating.hist(ratings_all, bins=bins, edgecolor="black")
-            self._ax_rating.set_title("Ratings distribution (rated only)")
-            self._ax_rating.set_xlabel("Rating")
-            self._ax_rating.set_ylabel("Count")
-        else:
-            self._ax_rating.set_title("Ratings distribution (no ratings)")
-        self._fig_rating.tight_layout()
-        self._canvas_rating.draw_idle()
+        f_items = _top_n(formats, 10)
+        f_labels = [i[0] for i in f_items]
+        f_vals = [i[1] for i in f_items]
+        self._show_bars("format", tuple(f_labels), f_vals, lambda ax: ax.bar(range(len(f_labels)), f_vals),
+                        "Top formats", "Top formats (no format data)",
+                        ylabel="Books", ticklabels=f_labels)
+
+        # Rating histogram (all rated); half-star bins, binned here so the bars can be reused
+        bins = [x / 2 for x in range(0, 11)]  # 0..5 in 0.5
+        has_ratings = len(ratings_all) > 0
+        r_counts = np.histogram(ratings_all, bins=bins)[0] if has_ratings else []
+        self._show_bars("rating", tuple(bins) if has_ratings else (), r_counts,
+                        lambda ax: ax.bar(bins[:-1], r_counts, width=0.5, align="edge", edgecolor="black"),
+                        "Ratings distribution (rated only)", "Ratings distribution (no ratings)",
+                        xlabel="Rating", ylabel="Count")
 
         # Top tags
-        self._ax_tags.clear()
-        if tags:
-            items = tags.most_common(12)
-            labels = [i[0] for i in items]
-            vals = [i[1] for i in items]
-            self._ax_tags.bar(range(len(labels)), vals)
-            self._ax_tags.set_title("Top tags")
-            self._ax_tags.set_ylabel("Books")
-            self._ax_tags.set_xticks(range(len(labels)))
-            self._ax_tags.set_xticklabels(labels, rotation=30, ha="right")
-        else:
-            self._ax_tags.set_title("Top tags (no tags)")
-        self._fig_tags.tight_layout()
-        self._canvas_tags.draw_idle()
+        t_items = _top_n(tags, 12)
+        t_labels = [i[0] for i in t_items]
+        t_vals = [i[1] for i in t_items]
+        self._show_bars("tags", tuple(t_labels), t_vals, lambda ax: ax.bar(range(len(t_labels)), t_vals),
+                        "Top tags", "Top tags (no tags)",
+                        ylabel="Books", ticklabels=t_labels)
 
         # Page-length distribution (known pages)
-        self._ax_len.clear()
-        pages = [b.pages for b in self.books if b.pages is not None]
-        if pages:
-            # coarse bins in 100-page increments
-            maxp = max(pages)
-            step = 100
-            bins = list(range(0, (maxp // step + 2) * step, step))
-            self._ax_len.hist(pages, bins=bins, edgecolor="black")
-            self._ax_len.set_title("Page count distribution (known pages)")
-            self._ax_len.set_xlabel("Pages")
-            self._ax_len.set_ylabel("Books")
-        else:
-            self._ax_len.set_title("Page count distribution (no pages)")
-        self._fig_len.tight_layout()
-        self._canvas_len.draw_idle()
+        pages = np.frombuffer(self._columns.pages, dtype=np.int64)
+        pages = pages[pages != _MISSING_INT]
+        # coarse bins in 100-page increments; binned here and drawn as plain bars
+        step = 100
+        edges = np.arange(0, (int(pages.max()) // step + 2) * step, step) if pages.size else np.arange(0)
+        l_counts = np.histogram(pages, bins=edges)[0] if pages.size else []
+        self._show_bars("len", tuple(edges.tolist()), l_counts,
+                        lambda ax: ax.bar(edges[:-1], l_counts, width=step, align="edge", edgecolor="black"),
+                        "Page count distribution (known pages)", "Page count distribution (no pages)",
+                        xlabel="Pages", ylabel="Books")
 
     # ----------------------------
     # File operations + refresh
@@ -1765,17 +2685,33 @@ class BookStatsApp(tk.Tk):
             self.load_json(path)
 
     def load_json(self, path: str):
+        # Summary edits for the previous file must land before it is replaced
+        self._flush_pending_raw_json()
+        self._raw_json = None
+        self._raw_json_path = None
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            if not isinstance(data, dict):
-                raise ValueError("Top-level JSON must be an object (dict).")
-            self.books = parse_books(data)
+            books = load_cached_books(self.cache_dir, path)
+            if books is None:
+                if _HAS_IJSON and os.path.getsize(path) >= _STREAM_PARSE_MIN_BYTES:
+                    books = parse_book_records(iter_records_from_path(path))
+                else:
+                    data = _load_json_file(path)
+                    if not isinstance(data, dict):
+                        raise ValueError("Top-level JSON must be an object (dict).")
+                    books = parse_books(data)
+                    self._raw_json = data
+                    self._raw_json_path = path
+                save_cached_books(self.cache_dir, path, books)
+            self.books = books
             self.current_path = path
+            _ensure_json_backup(path)
+            self._rebuild_filter_indexes()
+            self._columns = build_book_columns(self.books)
+            self._populate_tree_initial(self.books)
 
             # Persist last opened file
             self.settings["last_opened_path"] = path
-            save_settings(self.data_dir, self.settings)
+            self._schedule_save_settings()
 
             # Default sort state (Author last name)
             self.sort_col = "Author"
@@ -1783,9 +2719,47 @@ class BookStatsApp(tk.Tk):
 
             self.status_var.set(f"Loaded {len(self.books):,} books from: {os.path.basename(path)}")
             self._refresh_all()
+            self._prefetch_covers()
         except Exception as e:
             messagebox.showerror("Load failed", f"Could not load JSON:\n{e}")
 
+    def _rebuild_filter_indexes(self):
+        """
+        Build reverse indexes (value -> ascending indices into self.books) so
+        tag/media/collection filters only touch matching books.
+
+        Tags and formats are keyed lowercased (the Library filters compare
+        case-insensitively); collections keep their exact names, matching the
+        Random Picker listbox. _by_quick holds one posting per _QUICK_FILTERS
+        choice (Read, Owned, ...).
+        """
+        by_tag: Dict[str, List[int]] = defaultdict(list)
+        by_format: Dict[str, List[int]] = defaultdict(list)
+        by_collection: Dict[str, List[int]] = defaultdict(list)
+        tag_names: Set[str] = set()
+        format_names: Set[str] = set()
+        for i, b in enumerate(self.books):
+            tag_names.update(b.tags)
+            format_names.update(b.formats)
+            for t in {t.lower() for t in b.tags}:
+                by_tag[t].append(i)
+            for f in {f.lower() for f in b.formats}:
+                by_format[f].append(i)
+            for c in set(b.collections):
+                by_collection[c].append(i)
+        self._by_tag = dict(by_tag)
+        self._by_format = dict(by_format)
+        self._by_collection = dict(by_collection)
+        self._tag_names = tag_names
+        self._format_names = format_names
+        self._last_search = None
+        self._last_filter_sig = None
+        positions = range(len(self.books))
+        self._by_quick = {
+            name: list(compress(positions, map(pred, self.books)))
+            for name, pred in _QUICK_FILTERS.items()
+        }
+
     def _refresh_all(self):
         self._refresh_collections_list()
         self._refresh_library_filter_dropdowns()
@@ -1793,30 +2767,34 @@ class BookStatsApp(tk.Tk):
         self.refresh_stats()
 
     def _refresh_collections_list(self):
-        self.collections_list.delete(0, "end")
-        if not self.books:
+        # _by_collection is keyed by every collection name (see _rebuild_filter_indexes)
+        all_cols = tuple(sorted(c for c in self._by_collection if c)) if self.books else ()
+        if all_cols == self._last_collections_key:
             return
-        all_cols = sorted({c for b in self.books for c in b.collections if c})
-        for c in all_cols:
-            self.collections_list.insert("end", c)
+        self._last_collections_key = all_cols
+        self.collections_list.delete(0, "end")
+        if all_cols:
+            self.collections_list.insert("end", *all_cols)
 
     def _refresh_library_filter_dropdowns(self):
         # Populate Tag + Media dropdown options based on the loaded library
         if not self.books:
+            self._last_tag_values = self._last_media_values = ("Any",)
             self.tag_filter.configure(values=["Any"])
             self.media_filter.configure(values=["Any"])
             self.tag_filter_var.set("Any")
             self.media_filter_var.set("Any")
             return
 
-        all_tags = sorted({t for b in self.books for t in b.tags if t})
-        all_media = sorted({f for b in self.books for f in b.formats if f})
-
-        tag_values = ["Any"] + all_tags
-        media_values = ["Any"] + all_media
+        tag_values = ("Any",) + tuple(sorted(t for t in self._tag_names if t))
+        media_values = ("Any",) + tuple(sorted(f for f in self._format_names if f))
 
-        self.tag_filter.configure(values=tag_values)
-        self.media_filter.configure(values=media_values)
+        if tag_values != self._last_tag_values:
+            self._last_tag_values = tag_values
+            self.tag_filter.configure(values=list(tag_values))
+        if media_values != self._last_media_values:
+            self._last_media_values = media_values
+            self.media_filter.configure(values=list(media_values))
 
         # Keep current selection if still valid
         if self.tag_filter_var.get() not in tag_values:
@@ -1857,6 +2835,75 @@ class BookStatsApp(tk.Tk):
 
     # ----- Covers -----
 
+    def _prefetch_covers(self):
+        """
+        Warm the on-disk cover cache for the first rows of the Library view on a
+        small thread pool, so opening those books shows their cover immediately.
+
+        Books with an ISBN get their covers downloaded in one CoverCache.get_many
+        job (fetched concurrently on the cache's own pool). Books without one are
+        resolved together with CoverCache.search_batch (one search request per
+        chunk rather than per book); their covers still download on demand.
+        """
+        if not self.covers_enabled or not self.cover_cache:
+            return
+        if self._cover_prefetch_pool is None:
+            self._cover_prefetch_pool = ThreadPoolExecutor(
+                max_workers=_COVER_PREFETCH_WORKERS, thread_name_prefix="cover-prefetch"
+            )
+        cache = self.cover_cache
+        inflight = self._cover_prefetch_inflight
+        to_fetch: List[str] = []
+        to_search: List[Tuple[str, str]] = []
+        for b in self.filtered_books[:_COVER_PREFETCH_ROWS]:
+            isbn = (b.isbn or "").strip()
+            if not isbn:
+                if b.title and (b.title, b.display_author) not in inflight:
+                    to_search.append((b.title, b.display_author))
+                continue
+            if isbn in inflight:
+                continue
+            inflight.add(isbn)
+            to_fetch.append(isbn)
+        if to_fetch:
+            try:
+                fut = self._cover_prefetch_pool.submit(cache.get_many, to_fetch, "L")
+            except RuntimeError:
+                # Pool already shut down (app closing)
+                inflight.difference_update(to_fetch)
+                return
+            fut.add_done_callback(lambda _f, ks=to_fetch: inflight.difference_update(ks))
+        if to_search and hasattr(cache, "search_batch"):
+            inflight.update(to_search)
+            try:
+                fut = self._cover_prefetch_pool.submit(cache.search_batch, to_search)
+            except RuntimeError:
+                inflight.difference_update(to_search)
+                return
+            fut.add_done_callback(lambda _f, ks=to_search: inflight.difference_update(ks))
+
+    def destroy(self):
+        # Write any settings/summary change still waiting on its debounce timer.
+        if getattr(self, "_settings_save_after_id", None):
+            try:
+                self.after_cancel(self._settings_save_after_id)
+            except Exception:
+                pass
+            self._flush_settings()
+        self._flush_pending_raw_json()
+        # Drop queued prefetches so exit doesn't wait on the network.
+        pool = getattr(self, "_cover_prefetch_pool", None)
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+            self._cover_prefetch_pool = None
+        pool = getattr(self, "_stats_pool", None)
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+            self._stats_pool = None
+        if getattr(self, "cover_cache", None) is not None:
+            self._close_cover_cache()
+        super().destroy()
+
     def _clear_cover_label(self, label: Optional[ttk.Label], key: str):
         if label is None:
             return
@@ -1874,7 +2921,7 @@ class BookStatsApp(tk.Tk):
         If enabled and the book's summary is empty, save a fetched summary back
         into the currently loaded JSON file (and update the in-memory Book).
 
-        Creates a one-time .bak backup alongside the JSON before first write.
+        The file is rewritten on a short debounce (see _flush_raw_json).
         """
         try:
             if not self.settings.get("auto_fill_summary", True):
@@ -1889,18 +2936,8 @@ class BookStatsApp(tk.Tk):
             book.summary = new_summary.strip()
             book.summary_checked = True
 
-            path = self.current_path
-            backup = path + ".bak"
-            if (not os.path.exists(backup)) and os.path.exists(path):
-                try:
-                    import shutil
-                    shutil.copy2(path, backup)
-                except Exception:
-                    pass
-
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            if not isinstance(data, dict):
+            data = self._raw_json_for_write()
+            if data is None:
                 return
 
             key = str(book.books_id)
@@ -1908,8 +2945,7 @@ class BookStatsApp(tk.Tk):
             if isinstance(raw, dict) and (not str(raw.get("summary") or "").strip()):
                 raw["summary"] = book.summary
                 raw["summary_checked"] = True
-                with open(path, "w", encoding="utf-8") as f:
-                    json.dump(data, f, ensure_ascii=False, indent=2)
+                self._schedule_raw_json_write()
         except Exception:
             return
 
@@ -1928,29 +2964,74 @@ class BookStatsApp(tk.Tk):
                 return
 
             book.summary_checked = True
-            path = self.current_path
-            backup = path + ".bak"
-            if (not os.path.exists(backup)) and os.path.exists(path):
-                try:
-                    import shutil
-                    shutil.copy2(path, backup)
-                except Exception:
-                    pass
 
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            if not isinstance(data, dict):
+            data = self._raw_json_for_write()
+            if data is None:
                 return
 
             key = str(book.books_id)
             raw = data.get(key)
             if isinstance(raw, dict):
                 raw["summary_checked"] = True
-                with open(path, "w", encoding="utf-8") as f:
-                    json.dump(data, f, ensure_ascii=False, indent=2)
+                self._schedule_raw_json_write()
         except Exception:
             return
 
+    def _raw_json_for_write(self) -> Optional[Dict[str, Any]]:
+        """Parsed JSON of the current file; read from disk at most once per loaded file."""
+        path = self.current_path
+        if self._raw_json is not None and self._raw_json_path == path:
+            return self._raw_json
+        self._flush_pending_raw_json()
+        data = _load_json_file(path)
+        if not isinstance(data, dict):
+            return None
+        self._raw_json = data
+        self._raw_json_path = path
+        return data
+
+    def _schedule_raw_json_write(self, delay_ms: int = 2000):
+        """Coalesce bursts of summary write-backs into a single rewrite of the JSON file."""
+        if self._raw_json_save_after_id:
+            try:
+                self.after_cancel(self._raw_json_save_after_id)
+            except Exception:
+                pass
+        self._raw_json_save_after_id = self.after(delay_ms, self._flush_raw_json)
+
+    def _flush_pending_raw_json(self):
+        if getattr(self, "_raw_json_save_after_id", None):
+            try:
+                self.after_cancel(self._raw_json_save_after_id)
+            except Exception:
+                pass
+            self._flush_raw_json()
+
+    def _flush_raw_json(self):
+        """
+        Write the in-memory JSON back to its file (temp file + fsync + os.replace).
+
+        The .bak backup is taken once at load time (see _ensure_json_backup).
+        """
+        self._raw_json_save_after_id = None
+        path = self._raw_json_path
+        if self._raw_json is None or not path:
+            return
+        tmp = path + ".tmp"
+        try:
+            payload = _json_dumps_pretty(self._raw_json)
+            with open(tmp, "wb") as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, path)
+        except Exception:
+            try:
+                if os.path.exists(tmp):
+                    os.remove(tmp)
+            except Exception:
+                pass
+
 
     def _set_cover_label_for_book(self, label: Optional[ttk.Label], b: Book, key: str, details_text: Optional[tk.Text] = None):
         if label is None:
@@ -1990,6 +3071,78 @@ class BookStatsApp(tk.Tk):
         if hasattr(label, "image"):
             label.image = None
 
+        want_summary = bool(
+            book is not None
+            and (not (book.summary or "").strip())
+            and (not getattr(book, "summary_checked", False))
+            and self.settings.get("auto_fill_summary", True)
+        )
+
+        def apply_summary(summary: str):
+            # Persist summary even if there is no cover image or Pillow isn't installed.
+            try:
+                if book is not None and summary:
+                    self._maybe_persist_summary(book, summary)
+            except Exception:
+                pass
+
+            # If we asked for a summary but the source had none, mark it as checked
+            # so we don't keep pinging the server on every open.
+            try:
+                if book is not None and (not str(summary).strip()):
+                    self._maybe_mark_summary_checked(book)
+            except Exception:
+                pass
+
+            # If this cover load is tied to an open Book Details window, refresh its text
+            # so the newly saved summary appears immediately.
+            try:
+                if book is not None and details_text is not None and details_text.winfo_exists():
+                    y = details_text.yview()
+                    details_text.configure(state="normal")
+                    details_text.delete("1.0", "end")
+                    if key == "random" and getattr(self, "_random_last_pool_size", None) is not None:
+                        details_text.insert("1.0", self._book_text(book, pool_size=getattr(self, "_random_last_pool_size")))
+                    else:
+                        details_text.insert("1.0", self._book_text(book))
+                    details_text.configure(state="disabled")
+                    if isinstance(y, tuple) and y:
+                        details_text.yview_moveto(y[0])
+            except Exception:
+                pass
+
+        def apply_cover(path: Optional[str]):
+            if not label.winfo_exists():
+                return
+
+            if not path:
+                label.configure(text="(No cover found)", image="")
+                return
+            if not _ensure_pil():
+                label.configure(text="(Install Pillow for covers)", image="")
+                return
+            try:
+                # Fit within a reasonable preview box
+                img = None
+                if hasattr(self.cover_cache, "get_thumbnail"):
+                    img = self.cover_cache.get_thumbnail(path, (220, 320))
+                if img is None:
+                    img = Image.open(path)
+                    img.thumbnail((220, 320))
+                photo = ImageTk.PhotoImage(img)
+                label.configure(image=photo, text="")
+                label.image = photo  # keep alive
+                self._img_refs[key] = photo
+            except FileNotFoundError:
+                # Cache entry vanished (e.g. cleared) since the lookup
+                label.configure(text="(No cover found)", image="")
+            except Exception:
+                label.configure(text="(Could not load cover)", image="")
+                return
+
+        # The summary has its own request so the cover can show without waiting on it
+        separate_summary = want_summary and hasattr(self.cover_cache, "fetch_summary_async")
+
         def on_done_extras(extras: Any):
             # extras can be either a dict {"path": ..., "summary": ...} or a raw path
             path: Optional[str] = None
@@ -2001,68 +3154,20 @@ class BookStatsApp(tk.Tk):
                 path = extras
 
             def apply_on_ui_thread():
-                # Persist summary even if there is no cover image or Pillow isn't installed.
-                try:
-                    if book is not None and summary:
-                        self._maybe_persist_summary(book, summary)
-                except Exception:
-                    pass
-
-                # If we asked for a summary but the source had none, mark it as checked
-                # so we don't keep pinging the server on every open.
-                try:
-                    if book is not None and want_summary and (not str(summary).strip()):
-                        self._maybe_mark_summary_checked(book)
-                except Exception:
-                    pass
-
-                # If this cover load is tied to an open Book Details window, refresh its text
-                # so the newly saved summary appears immediately.
-                try:
-                    if book is not None and details_text is not None and details_text.winfo_exists() and want_summary:
-                        y = details_text.yview()
-                        details_text.configure(state="normal")
-                        details_text.delete("1.0", "end")
-                        if key == "random" and getattr(self, "_random_last_pool_size", None) is not None:
-                            details_text.insert("1.0", self._book_text(book, pool_size=getattr(self, "_random_last_pool_size")))
-                        else:
-                            details_text.insert("1.0", self._book_text(book))
-                        details_text.configure(state="disabled")
-                        if isinstance(y, tuple) and y:
-                            details_text.yview_moveto(y[0])
-                except Exception:
-                    pass
-
-                if not label.winfo_exists():
-                    return
-
-                if not path or not os.path.exists(path):
-                    label.configure(text="(No cover found)", image="")
-                    return
-                if not _HAS_PIL or Image is None or ImageTk is None:
-                    label.configure(text="(Install Pillow for covers)", image="")
-                    return
-                try:
-                    img = Image.open(path)
-                    # Fit within a reasonable preview box
-                    img.thumbnail((220, 320))
-                    photo = ImageTk.PhotoImage(img)
-                    label.configure(image=photo, text="")
-                    label.image = photo  # keep alive
-                    self._img_refs[key] = photo
-                except Exception:
-                    label.configure(text="(Could not load cover)", image="")
-                    return
+                if want_summary and not separate_summary:
+                    apply_summary(summary)
+                apply_cover(path)
 
             self.after(0, apply_on_ui_thread)
 
         try:
-            want_summary = bool(
-                book is not None
-                and (not (book.summary or "").strip())
-                and (not getattr(book, "summary_checked", False))
-                and self.settings.get("auto_fill_summary", True)
-            )
+            if separate_summary:
+                self.cover_cache.fetch_summary_async(  # type: ignore
+                    isbn,
+                    title=title,
+                    author=author,
+                    on_done=lambda summary: self.after(0, apply_summary, summary),
+                )
 
             # Prefer the richer API if available (supports ISBN + title/author fallback + summary)
             if hasattr(self.cover_cache, "fetch_async_extras"):
@@ -2071,7 +3176,7 @@ class BookStatsApp(tk.Tk):
                     size="L",
                     title=title,
                     author=author,
-                    want_summary=want_summary,
+                    want_summary=want_summary and not separate_summary,
                     on_done=on_done_extras,
                 )
             else:
@@ -2101,33 +3206,8 @@ class BookStatsApp(tk.Tk):
         if pool_size is not None:
             lines.append(f"Random pick from {pool_size:,} matching books\n")
 
-        lines.append(f"Title: {b.title}")
-        if b.display_author:
-            lines.append(f"Author: {b.display_author}")
-        if b.year:
-            lines.append(f"Year: {b.year}")
-        if b.pages:
-            lines.append(f"Pages: {b.pages}")
-        if getattr(b, "isbn", ""):
-            lines.append(f"ISBN: {b.isbn}")
-        if b.primary_format():
-            lines.append(f"Format: {b.primary_format()}")
-        if b.tags:
-            lines.append(f"Tags: {', '.join(b.tags)}")
-        if b.rating is not None:
-            lines.append(f"Rating: {b.rating:g}")
-        if b.collections:
-            lines.append(f"Collections: {', '.join(b.collections)}")
-        if b.genre:
-            lines.append(f"Genres: {', '.join(b.genre)}")
-        if b.series:
-            lines.append(f"Series: {', '.join(b.series)}")
-        if b.dateread:
-            lines.append(f"Date read: {b.dateread}")
-        if b.entrydate:
-            lines.append(f"Entry date: {b.entrydate}")
-        if b.publication:
-            lines.append(f"Publication: {b.publication}")
+        # Everything but the summary is fixed after parsing and built once per Book
+        lines.append(b.details_text())
 
         if b.summary:
             lines.append("\nSummary:\n" + b.summary)
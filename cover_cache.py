@@ -12,20 +12,94 @@ Fallback (when ISBN missing OR no ISBN cover is found):
     We request specific fields to avoid relying on defaults.
 
 Notes:
-- Uses requests for HTTP.
+- Uses requests for HTTP, through one pooled Session per CoverCache so repeated
+  fetches from covers.openlibrary.org / openlibrary.org reuse their connections.
+  If httpx is installed it is used instead (HTTP/2 when the h2 package is also
+  available, so concurrent fetches share one connection per host).
 - The GUI can optionally use Pillow (PIL) to load/display the downloaded images.
 """
 
 from __future__ import annotations
 
 import hashlib
+import importlib.util
+import json
+import mmap
 import os
 import re
 import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import Callable, Dict, Optional, Tuple
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+from urllib.parse import urlencode
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import httpx  # optional
+except ImportError:  # pragma: no cover
+    httpx = None  # type: ignore
+
+# Retries for throttling and transient server errors, shared by the Session's
+# urllib3 Retry and the httpx path (see _get / _get_stream)
+_RETRY_TOTAL = 2
+_RETRY_BACKOFF_S = 0.3
+_RETRY_STATUSES = frozenset((429, 500, 502, 503, 504))
+# Longest Retry-After the httpx path waits out; a fetch thread sleeps meanwhile
+_RETRY_AFTER_MAX_S = 30.0
+
+
+def _retry_delay(attempt: int, headers: Any) -> float:
+    """Seconds to wait before retry number attempt + 1: Retry-After if given, else backoff."""
+    retry_after = headers.get("Retry-After")
+    if retry_after:
+        try:
+            return min(max(0.0, float(retry_after)), _RETRY_AFTER_MAX_S)
+        except ValueError:
+            # HTTP-date form; fall back to the backoff
+            pass
+    return _RETRY_BACKOFF_S * (2 ** attempt)
+
+# Only advertise brotli when a decoder for it is installed (urllib3/httpx use it then)
+_ACCEPT_ENCODING = "gzip, deflate" + (", br" if importlib.util.find_spec("brotli") or importlib.util.find_spec("brotlicffi") else "")
+
+# Optional fast JSON for Open Library responses (pip install orjson)
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
+
+
+def json_loads(raw: bytes) -> Any:
+    """Parse JSON bytes, using orjson when available (stdlib json otherwise)."""
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # orjson is stricter (e.g. NaN, huge ints); let stdlib have a go.
+            pass
+    return json.loads(raw)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj)
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+
+# str.translate table deleting every ASCII char except 0-9 and X; anything
+# non-ASCII left over goes through _NON_ISBN_RE
+_ISBN_ASCII_DELETE = {c: None for c in range(128) if chr(c) not in "0123456789X"}
+_NON_ISBN_RE = re.compile(r"[^0-9X]")
 
 
 def normalize_isbn(isbn: str) -> str:
@@ -35,32 +109,148 @@ def normalize_isbn(isbn: str) -> str:
     """
     if not isbn:
         return ""
-    s = isbn.strip().upper()
-    s = re.sub(r"[^0-9X]", "", s)
+    return _normalize_isbn_cached(isbn)
+
+
+@lru_cache(maxsize=4096)
+def _normalize_isbn_cached(isbn: str) -> str:
+    # Each book's ISBN is normalized again on every cover/summary lookup
+    s = isbn.strip().upper().translate(_ISBN_ASCII_DELETE)
+    if not s.isascii():
+        s = _NON_ISBN_RE.sub("", s)
     return s
 
 
+def is_plausible_isbn(safe: str) -> bool:
+    """
+    Cheap shape check on a normalized ISBN: 13 digits, or 9 digits plus a digit/X.
+    Anything else would only earn a 404, so it is never requested.
+    """
+    n = len(safe)
+    if n == 13:
+        return safe.isdigit()
+    if n == 10:
+        return safe[:9].isdigit() and safe[9] in "0123456789X"
+    return False
+
+
+_ISBN13_PREFIXES = frozenset(("978", "979"))
+
+
 def choose_best_isbn(*candidates: str) -> str:
     """
     Prefer ISBN-13 (13 digits starting with 978/979), else ISBN-10.
     """
     cleaned = [normalize_isbn(c) for c in candidates if c]
-    cleaned = [c for c in cleaned if len(c) in (10, 13)]
+    cleaned = [c for c in cleaned if is_plausible_isbn(c)]
     if not cleaned:
         return ""
     for c in cleaned:
-        if len(c) == 13 and (c.startswith("978") or c.startswith("979")):
+        if len(c) == 13 and c[:3] in _ISBN13_PREFIXES:
             return c
     return cleaned[0]
 
 
+def _cover_url_template(kind: str, size: str) -> str:
+    """Covers API URL with a %s placeholder for the ISBN / cover id."""
+    size = (size or "L").upper()
+    return f"https://covers.openlibrary.org/b/{kind}/%s-{size}.jpg?default=false"
+
+
+# Anything smaller than this is not a real cover (e.g. a placeholder or error page)
+_MIN_COVER_BYTES = 200
+
+# Prebuilt Covers API URL templates for the S/M/L sizes the app asks for
+_ISBN_URL_BY_SIZE = {s: _cover_url_template("isbn", s) for s in ("S", "M", "L")}
+_COVERID_URL_BY_SIZE = {s: _cover_url_template("id", s) for s in ("S", "M", "L")}
+
+
+_SEARCH_EXTRAS_FIELDS = "title,author_name,cover_i,isbn,key,edition_key,first_publish_year"
+
+
+def _match_text(s: str) -> str:
+    """Lowercase words only, for loose title/author comparisons."""
+    return " ".join(re.findall(r"[0-9a-z]+", (s or "").lower()))
+
+
+def _solr_quote(s: str) -> str:
+    return s.replace("\\", "\\\\").replace('"', '\\"')
+
+
+def _best_search_doc(docs: List[Any]) -> Optional[Dict[str, Any]]:
+    """Pick a /search.json doc: the first with a cover, else the first with ISBNs."""
+    # Prefer: has cover_i and matches roughly
+    for d in docs:
+        if not isinstance(d, dict):
+            continue
+        if d.get("cover_i"):
+            return d
+
+    # Otherwise return the first doc that has ISBNs
+    for d in docs:
+        if not isinstance(d, dict):
+            continue
+        isbns = d.get("isbn")
+        if isinstance(isbns, list) and isbns:
+            return d
+
+    return None
+
+
+def _canon_work_key(key: str) -> str:
+    """
+    Open Library work key as "/works/OL123W". Keys usually arrive that way but
+    sometimes show up as "OL123W", "works/OL123W" or a full URL.
+    """
+    key = (key or "").strip()
+    if not key:
+        return ""
+    if key.startswith(("http://", "https://")):
+        key = "/" + key.split("openlibrary.org", 1)[-1].lstrip("/")
+    if key.startswith("works/"):
+        key = "/" + key
+    if not key.startswith("/"):
+        # Assume bare work id
+        key = "/works/" + key
+    return key
+
+
+def _canon_edition_key(key: str) -> str:
+    """Open Library edition key as "OL123M" (from "/books/OL123M", "books/OL123M", ...)."""
+    key = (key or "").strip().lstrip("/")
+    if key.startswith("books/"):
+        key = key[len("books/"):]
+    return key.lstrip("/")
+
+
+# _known default for files not in the cache
+_NOT_CACHED = (0, 0.0)
+
+# _read_json_file result when there is no fresh cached answer (None is a cached 404)
+_MISSING = object()
+
+
+@lru_cache(maxsize=4096)
 def _stable_hash_key(*parts: str) -> str:
     """
     Produce a stable short key for caching non-ISBN lookups (title/author).
     """
     joined = "||".join((p or "").strip().lower() for p in parts)
-    h = hashlib.sha1(joined.encode("utf-8")).hexdigest()
-    return h[:16]
+    return hashlib.blake2b(joined.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def _map_readonly(path: str) -> Optional[mmap.mmap]:
+    """
+    Read-only mapping of a whole file, or None if it is missing or empty.
+    The mapping is file-like (read/seek), so PIL can open it directly.
+    """
+    try:
+        with open(path, "rb") as f:
+            # The mapping keeps its own handle, so the file can be closed now
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        # ValueError: mapping an empty file
+        return None
 
 
 @dataclass
@@ -69,22 +259,232 @@ class CoverCache:
     timeout_s: float = 10.0
     user_agent: str = "BookStatsGUI/1.0 (+local)"
     base_search_url: str = "https://openlibrary.org/search.json"
+    # Search/description JSON responses are reused (in-process and from the
+    # json_*.json files in cache_dir) for this long
+    memo_ttl_s: float = 6 * 3600
+    memo_maxsize: int = 1024
+    # Covers the API answered 404 for are not re-requested for this long
+    missing_ttl_s: float = 7 * 86400
+    # Decoded, shrunk cover images kept by get_thumbnail
+    max_thumbs: int = 512
+    # Once cache_dir holds more than this, the oldest files are deleted (0 = no limit)
+    max_cache_bytes: int = 2 * 1024 ** 3
 
     def __post_init__(self):
         os.makedirs(self.cache_dir, exist_ok=True)
 
+        # cache_dir listing: file name -> (size, mtime), oldest first. Read once with
+        # scandir and kept current by the writers below, so cache probes don't stat
+        # the disk. _known_lock serializes the writers and keeps _cache_bytes exact.
+        listing: List[Tuple[str, Tuple[int, float]]] = []
+        with os.scandir(self.cache_dir) as it:
+            for entry in it:
+                try:
+                    if entry.is_file():
+                        st = entry.stat()
+                        listing.append((entry.name, (st.st_size, st.st_mtime)))
+                except OSError:
+                    pass
+        listing.sort(key=lambda item: item[1][1])
+        self._known: Dict[str, Tuple[int, float]] = dict(listing)
+        self._cache_bytes = sum(size for size, _ in self._known.values())
+        self._known_lock = threading.Lock()
+        with self._known_lock:
+            self._evict_locked()
+
+        # One keep-alive Session for every request; throttling and transient server
+        # errors are retried (honouring Retry-After)
+        self._session = requests.Session()
+        self._session.headers.update(self._default_headers())
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=32,
+            max_retries=Retry(total=_RETRY_TOTAL, backoff_factor=_RETRY_BACKOFF_S, status_forcelist=_RETRY_STATUSES),
+        )
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+
+        # Preferred over the Session when httpx is installed (see _get / _get_stream)
+        self._client = None
+        if httpx is not None:
+            self._client = self._make_httpx_client()
+
+        # (kind, isbn/cover id, size) -> cover file path (see cache_path_isbn/_coverid)
+        self._paths: Dict[Tuple[str, Any, str], str] = {}
+
+        # out_path -> Event set when the download currently writing it finishes
+        self._inflight: Dict[str, threading.Event] = {}
+        self._inflight_lock = threading.Lock()
+
+        # fetch_async* run here; sized to roughly match the connection pool
+        self._pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="covercache")
+        # (fn, args, kwargs) -> Future of the identical _submit call still running
+        self._pending: Dict[Tuple[Any, ...], Future[Any]] = {}
+        self._pending_lock = threading.Lock()
+
+        # (url, params) -> (monotonic time fetched, parsed JSON or None); LRU order
+        self._json_memo: OrderedDict[Tuple[str, Tuple[Tuple[str, str], ...]], Tuple[float, Any]] = OrderedDict()
+        self._json_memo_lock = threading.Lock()
+        # search_batch() matches, keyed like _search_openlibrary_best_extras lookups
+        self._batch_docs: Dict[Tuple[str, str], Dict[str, Any]] = {}
+
+        # (path, box w, box h, file mtime) -> PIL thumbnail; LRU order
+        self._thumbs: OrderedDict[Tuple[str, int, int, float], Any] = OrderedDict()
+        self._thumbs_lock = threading.Lock()
+
+    def shutdown(self, wait: bool = False) -> None:
+        """Stop the background fetch pool; queued fetches are dropped."""
+        self._pool.shutdown(wait=wait, cancel_futures=True)
+
+    def close(self) -> None:
+        """Stop accepting background fetches and release pooled connections."""
+        self.shutdown(wait=False)
+        self._session.close()
+        if self._client is not None:
+            self._client.close()
+
+    def clear(self) -> None:
+        """Delete every cached file (covers, markers, JSON answers) and forget them."""
+        try:
+            with os.scandir(self.cache_dir) as it:
+                for entry in it:
+                    try:
+                        if entry.is_file():
+                            os.remove(entry.path)
+                    except FileNotFoundError:
+                        # e.g. a .tmp a running download just renamed
+                        pass
+                    except OSError:
+                        # e.g. locked on Windows; still there, so it stays indexed
+                        continue
+                    # Unindexed per file, so a failed clear never leaves stale hits
+                    self._note_removed(entry.path)
+        finally:
+            with self._json_memo_lock:
+                self._json_memo.clear()
+                self._batch_docs.clear()
+            with self._thumbs_lock:
+                self._thumbs.clear()
+
+    def _cache_hit(self, path: str) -> bool:
+        """True if path (a file in cache_dir) is known to be non-empty."""
+        return self._known.get(os.path.basename(path), _NOT_CACHED)[0] > 0
+
+    def _cached_age(self, path: str) -> Optional[float]:
+        """Seconds since path (a file in cache_dir) was written, or None if absent."""
+        known = self._known.get(os.path.basename(path))
+        return None if known is None else time.time() - known[1]
+
+    def _note_written(self, path: str, size: int) -> None:
+        name = os.path.basename(path)
+        with self._known_lock:
+            # Re-inserted so it moves to the newest end of the eviction order
+            old = self._known.pop(name, _NOT_CACHED)
+            self._known[name] = (size, time.time())
+            self._cache_bytes += size - old[0]
+            self._evict_locked()
+
+    def _note_removed(self, path: str) -> None:
+        with self._known_lock:
+            old = self._known.pop(os.path.basename(path), _NOT_CACHED)
+            self._cache_bytes -= old[0]
+
+    def _evict_locked(self) -> None:
+        """
+        If cache_dir is over max_cache_bytes, delete the oldest-written files until
+        it is back under 90% of it. Caller holds _known_lock.
+        """
+        if not self.max_cache_bytes or self._cache_bytes <= self.max_cache_bytes:
+            return
+        target = self.max_cache_bytes * 9 // 10
+        for name, (size, _) in list(self._known.items()):
+            if self._cache_bytes <= target:
+                break
+            try:
+                os.remove(os.path.join(self.cache_dir, name))
+            except FileNotFoundError:
+                pass
+            except OSError:
+                continue
+            del self._known[name]
+            self._cache_bytes -= size
+
+    def _default_headers(self) -> Dict[str, str]:
+        return {
+            "User-Agent": self.user_agent,
+            # Search/description JSON compresses well; covers are JPEGs either way
+            "Accept-Encoding": _ACCEPT_ENCODING,
+            "Accept": "application/json, image/*;q=0.9, */*;q=0.5",
+        }
+
+    def _make_httpx_client(self) -> Any:
+        limits = httpx.Limits(max_keepalive_connections=8, max_connections=16)
+        try:
+            # Failed connects are retried by the transport; statuses by _get/_get_stream
+            transport = httpx.HTTPTransport(http2=True, limits=limits, retries=_RETRY_TOTAL)
+        except ImportError:
+            # http2=True needs the h2 package
+            transport = httpx.HTTPTransport(limits=limits, retries=_RETRY_TOTAL)
+        return httpx.Client(
+            timeout=self.timeout_s,
+            headers=self._default_headers(),
+            transport=transport,
+            # Covers API answers with redirects to the image host
+            follow_redirects=True,
+        )
+
+    def _get(self, url: str, params: Optional[Dict[str, str]] = None) -> Any:
+        """GET through httpx or the requests Session; the response has .status_code/.content."""
+        if self._client is not None:
+            # Same retry policy as the Session's urllib3 Retry
+            for attempt in range(_RETRY_TOTAL + 1):
+                r = self._client.get(url, params=params)
+                if r.status_code not in _RETRY_STATUSES or attempt == _RETRY_TOTAL:
+                    return r
+                time.sleep(_retry_delay(attempt, r.headers))
+        return self._session.get(url, params=params, timeout=self.timeout_s)
+
+    @contextmanager
+    def _get_stream(
+        self, url: str, headers: Optional[Dict[str, str]] = None
+    ) -> Iterator[Tuple[int, Any, Iterable[bytes]]]:
+        """Streamed GET: yields (status_code, response headers, body chunks)."""
+        if self._client is not None:
+            for attempt in range(_RETRY_TOTAL + 1):
+                with self._client.stream("GET", url, headers=headers) as r:
+                    if r.status_code not in _RETRY_STATUSES or attempt == _RETRY_TOTAL:
+                        yield r.status_code, r.headers, r.iter_bytes(64 * 1024)
+                        return
+                    delay = _retry_delay(attempt, r.headers)
+                time.sleep(delay)
+        else:
+            with self._session.get(url, headers=headers, timeout=self.timeout_s, stream=True) as r:
+                yield r.status_code, r.headers, r.iter_content(64 * 1024)
+
     # -----------------------------
     # Cache paths
     # -----------------------------
 
     def cache_path_isbn(self, isbn: str, size: str) -> str:
-        safe = normalize_isbn(isbn)
-        size = (size or "L").upper()
-        return os.path.join(self.cache_dir, f"isbn_{safe}_{size}.jpg")
+        key = ("isbn", isbn, size)
+        path = self._paths.get(key)
+        if path is None:
+            safe = normalize_isbn(isbn)
+            size = (size or "L").upper()
+            path = self._paths[key] = os.path.join(self.cache_dir, f"isbn_{safe}_{size}.jpg")
+        return path
 
     def cache_path_coverid(self, cover_id: int, size: str) -> str:
-        size = (size or "L").upper()
-        return os.path.join(self.cache_dir, f"olid_{cover_id}_{size}.jpg")
+        key = ("olid", cover_id, size)
+        path = self._paths.get(key)
+        if path is None:
+            size = (size or "L").upper()
+            path = self._paths[key] = os.path.join(self.cache_dir, f"olid_{cover_id}_{size}.jpg")
+        return path
+
+    def cache_path_json(self, url: str, params: Tuple[Tuple[str, str], ...] = ()) -> str:
+        key = hashlib.blake2b((url + "?" + urlencode(params)).encode("utf-8"), digest_size=16).hexdigest()
+        return os.path.join(self.cache_dir, f"json_{key}.json")
 
     def cache_path_query(self, title: str, author: str, size: str) -> str:
         size = (size or "L").upper()
@@ -96,13 +496,12 @@ class CoverCache:
     # -----------------------------
 
     def openlibrary_url_isbn(self, isbn: str, size: str) -> str:
-        size = (size or "L").upper()
-        safe = normalize_isbn(isbn)
-        return f"https://covers.openlibrary.org/b/isbn/{safe}-{size}.jpg?default=false"
+        template = _ISBN_URL_BY_SIZE.get(size) or _cover_url_template("isbn", size)
+        return template % normalize_isbn(isbn)
 
     def openlibrary_url_coverid(self, cover_id: int, size: str) -> str:
-        size = (size or "L").upper()
-        return f"https://covers.openlibrary.org/b/id/{cover_id}-{size}.jpg?default=false"
+        template = _COVERID_URL_BY_SIZE.get(size) or _cover_url_template("id", size)
+        return template % cover_id
 
     # -----------------------------
     # Public API
@@ -122,7 +521,7 @@ class CoverCache:
 
         Strategy:
           1) Try ISBN -> Covers API
-          2) If ISBN is missing OR no cover found:
+          2) If ISBN is missing/malformed OR no cover found:
              search by (title, author) using /search.json
              - If we find a cover_i, fetch via Covers API by id
              - Else if we find an ISBN, try ISBN fetch again
@@ -131,13 +530,13 @@ class CoverCache:
         """
         # 1) Try ISBN first if present
         safe_isbn = normalize_isbn(isbn)
-        if safe_isbn:
+        if is_plausible_isbn(safe_isbn):
             cached = self.cache_path_isbn(safe_isbn, size)
-            if (not force_refresh) and os.path.exists(cached) and os.path.getsize(cached) > 0:
+            if (not force_refresh) and self._cache_hit(cached):
                 return cached
 
             url = self.openlibrary_url_isbn(safe_isbn, size)
-            path = self._download_to(url, cached, allow_404=True)
+            path = self._download_to(url, cached, allow_404=True, force_refresh=force_refresh)
             if path:
                 return path
 
@@ -154,18 +553,80 @@ class CoverCache:
         if cover_id is not None:
             # Cache by cover id (most reliable fallback)
             cached = self.cache_path_coverid(cover_id, size)
-            if (not force_refresh) and os.path.exists(cached) and os.path.getsize(cached) > 0:
+            if (not force_refresh) and self._cache_hit(cached):
                 return cached
 
             url = self.openlibrary_url_coverid(cover_id, size)
-            return self._download_to(url, cached, allow_404=True)
+            return self._download_to(url, cached, allow_404=True, force_refresh=force_refresh)
 
         if found_isbn:
-            # Avoid infinite recursion by NOT passing title/author again here.
-            return self.get_cover_path(found_isbn, size=size, force_refresh=force_refresh)
+            # found_isbn is already normalized (choose_best_isbn)
+            cached = self.cache_path_isbn(found_isbn, size)
+            if (not force_refresh) and self._cache_hit(cached):
+                return cached
+            url = self.openlibrary_url_isbn(found_isbn, size)
+            return self._download_to(url, cached, allow_404=True, force_refresh=force_refresh)
 
         return None
 
+    def get_cover_bytes(
+        self,
+        isbn: str,
+        *,
+        size: str = "L",
+        title: Optional[str] = None,
+        author: Optional[str] = None,
+    ) -> Optional[memoryview]:
+        """
+        Like get_cover_path, but return the image bytes as a read-only memoryview
+        over an mmap of the cached file (no copy into a new bytes object).
+        The mapping is released once the view and anything derived from it are
+        dropped. Returns None if no cover is found.
+        """
+        path = self.get_cover_path(isbn, size=size, title=title, author=author)
+        if not path:
+            return None
+        mm = _map_readonly(path)
+        return memoryview(mm) if mm is not None else None
+
+    def get_thumbnail(self, path: str, box: Tuple[int, int]) -> Any:
+        """
+        The image at path shrunk to fit box, as a PIL Image, or None if Pillow is
+        missing or the file can't be decoded. Recently used thumbnails are kept
+        (max_thumbs of them), so showing a cover again skips the JPEG decode.
+        The returned image is shared: don't modify it.
+        """
+        # Re-downloading a cover changes its mtime, which retires the old entry
+        key = (path, box[0], box[1], self._known.get(os.path.basename(path), _NOT_CACHED)[1])
+        with self._thumbs_lock:
+            img = self._thumbs.get(key)
+            if img is not None:
+                self._thumbs.move_to_end(key)
+                return img
+
+        try:
+            from PIL import Image  # type: ignore
+        except ImportError:
+            return None
+        mm = _map_readonly(path)
+        if mm is None:
+            return None
+        try:
+            # The cached copy must not pin the mapping (and its file handle)
+            with mm:
+                with Image.open(mm) as src:
+                    src.thumbnail(box)
+                    img = src.copy()
+        except Exception:
+            return None
+
+        with self._thumbs_lock:
+            self._thumbs[key] = img
+            self._thumbs.move_to_end(key)
+            while len(self._thumbs) > self.max_thumbs:
+                self._thumbs.popitem(last=False)
+        return img
+
     def fetch_async(
         self,
         isbn: str,
@@ -176,38 +637,243 @@ class CoverCache:
         author: Optional[str] = None,
     ) -> None:
         """
-        Run get_cover_path in a background thread and call on_done(path_or_none).
+        Run get_cover_path on the background pool and call on_done(path_or_none).
         """
-        def worker():
-            path = self.get_cover_path(isbn, size=size, title=title, author=author)
-            on_done(path)
+        self._submit(on_done, None, self.get_cover_path, isbn, size=size, title=title, author=author)
 
-        t = threading.Thread(target=worker, daemon=True)
-        t.start()
+    def get_many(self, isbns: Iterable[str], size: str = "L") -> Dict[str, Optional[str]]:
+        """
+        Cover paths for many ISBNs at once: {isbn: path or None}, in input order.
+
+        Cache hits are answered inline; misses are downloaded concurrently on the
+        fetch pool (over one multiplexed HTTP/2 connection when httpx is in use).
+        ISBN lookups only, no title/author fallback. Blocks until all are done, so
+        don't call it from a fetch_async* callback.
+        """
+        found: Dict[str, Any] = {}
+        for isbn in isbns:
+            if isbn in found:
+                continue
+            safe = normalize_isbn(isbn)
+            if not is_plausible_isbn(safe):
+                found[isbn] = None
+                continue
+            cached = self.cache_path_isbn(safe, size)
+            if self._cache_hit(cached):
+                found[isbn] = cached
+                continue
+            url = self.openlibrary_url_isbn(safe, size)
+            found[isbn] = self._pool.submit(self._download_to, url, cached, allow_404=True)
+
+        out: Dict[str, Optional[str]] = {}
+        for isbn, v in found.items():
+            if isinstance(v, Future):
+                try:
+                    v = v.result()
+                except Exception:
+                    v = None
+            out[isbn] = v
+        return out
+
+    def _submit(self, on_done: Optional[Callable[[Any], None]], default: Any, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> None:
+        """
+        Run fn(*args, **kwargs) on the pool, then call on_done(result), or
+        on_done(default) if fn raised. Fetches cancelled by shutdown() call nothing.
+
+        A call identical to one still running (e.g. the GUI asking for the same
+        cover again while scrolling) joins that one instead of queueing a copy.
+        """
+        key = (fn, args, tuple(sorted(kwargs.items())))
+        with self._pending_lock:
+            fut = self._pending.get(key)
+            first = fut is None
+            if first:
+                fut = self._pending[key] = self._pool.submit(fn, *args, **kwargs)
+        if first:
+            # Outside the lock: the callback runs inline if fut is already done
+            fut.add_done_callback(lambda f: self._forget_pending(key, f))
+        if on_done is None:
+            return
+
+        def done(f: Future[Any]) -> None:
+            if f.cancelled():
+                return
+            on_done(default if f.exception() is not None else f.result())
+
+        fut.add_done_callback(done)
+
+    def _forget_pending(self, key: Tuple[Any, ...], fut: Future[Any]) -> None:
+        with self._pending_lock:
+            if self._pending.get(key) is fut:
+                del self._pending[key]
 
     # -----------------------------
     # Internals
     # -----------------------------
 
     def _download_to(self, url: str, out_path: str, *, allow_404: bool = False, force_refresh: bool = False) -> Optional[str]:
-        try:
-            if (not force_refresh) and os.path.exists(out_path) and os.path.getsize(out_path) > 0:
+        """
+        Stream url into out_path (via a .tmp file + os.replace, so a crash never
+        leaves a truncated image behind). Returns out_path, or None on failure.
+
+        A 404 leaves an out_path + ".404" marker; for missing_ttl_s after that the
+        URL is not requested again (unless force_refresh).
+
+        The response's ETag / Last-Modified go to out_path + ".meta"; a
+        force_refresh of a cached file sends them back, and a 304 keeps the file.
+
+        Concurrent calls for the same out_path share one download: later callers
+        wait for the first one and then read its result from disk.
+        """
+        marker = out_path + ".404"
+        if not force_refresh:
+            if self._cache_hit(out_path):
                 return out_path
+            age = self._cached_age(marker)
+            if age is not None and age < self.missing_ttl_s:
+                return None
 
-            r = requests.get(
-                url,
-                timeout=self.timeout_s,
-                headers={"User-Agent": self.user_agent},
-            )
-            if allow_404 and r.status_code == 404:
+        with self._inflight_lock:
+            ev = self._inflight.get(out_path)
+            first = ev is None
+            if first:
+                ev = self._inflight[out_path] = threading.Event()
+        if not first:
+            ev.wait(self.timeout_s + 1)
+            return out_path if self._cache_hit(out_path) else None
+        try:
+            validators = self._read_validators(out_path) if self._cache_hit(out_path) else None
+            return self._fetch_to_file(url, out_path, marker, validators)
+        finally:
+            with self._inflight_lock:
+                del self._inflight[out_path]
+            ev.set()
+
+    def _fetch_to_file(
+        self, url: str, out_path: str, marker: str, validators: Optional[Dict[str, str]] = None
+    ) -> Optional[str]:
+        tmp = out_path + ".tmp"
+        try:
+            with self._get_stream(url, validators) as (status, headers, chunks):
+                if status == 304 and validators:
+                    return out_path
+                if status == 404:
+                    open(marker, "wb").close()
+                    self._note_written(marker, 0)
+                    return None
+                if status != 200:
+                    return None
+                # Error pages / proxy interstitials must not end up cached as covers
+                if not str(headers.get("Content-Type") or "").lower().startswith("image/"):
+                    return None
+                with open(tmp, "wb") as f:
+                    for chunk in chunks:
+                        f.write(chunk)
+                    written = f.tell()
+            if written < _MIN_COVER_BYTES:
+                os.remove(tmp)
                 return None
-            if r.status_code == 200 and r.content:
-                with open(out_path, "wb") as f:
-                    f.write(r.content)
-                return out_path
+            os.replace(tmp, out_path)
+            self._note_written(out_path, written)
+            self._write_validators(out_path, headers)
+            return out_path
+        except Exception:
+            try:
+                if os.path.exists(tmp):
+                    os.remove(tmp)
+            except Exception:
+                pass
             return None
+
+    def _read_validators(self, out_path: str) -> Optional[Dict[str, str]]:
+        """Conditional-request headers for a cached cover, from its .meta file."""
+        meta_path = out_path + ".meta"
+        if not self._cache_hit(meta_path):
+            return None
+        try:
+            with open(meta_path, "rb") as f:
+                meta = json_loads(f.read())
         except Exception:
             return None
+        headers: Dict[str, str] = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+        return headers or None
+
+    def _write_validators(self, out_path: str, headers: Any) -> None:
+        etag = headers.get("ETag") or ""
+        last_modified = headers.get("Last-Modified") or ""
+        meta_path = out_path + ".meta"
+        if etag or last_modified:
+            self._write_json_file(meta_path, {"etag": etag, "last_modified": last_modified})
+        elif self._cache_hit(meta_path):
+            # Validators of an older copy no longer apply
+            try:
+                os.remove(meta_path)
+            except OSError:
+                pass
+            self._note_removed(meta_path)
+
+    def _get_json(self, url: str, params: Optional[Dict[str, str]] = None) -> Any:
+        """
+        GET url and return its parsed JSON, or None for any non-200 answer.
+
+        200/404/410 answers are memoized per (url, params) for memo_ttl_s, in
+        memory and in a json_*.json file in cache_dir. Other statuses, network and
+        decode errors are not, so a transient failure is retried on the next call.
+        """
+        key = (url, tuple(sorted(params.items())) if params else ())
+        now = time.monotonic()
+        memo = self._json_memo
+        with self._json_memo_lock:
+            hit = memo.get(key)
+            if hit is not None and now - hit[0] < self.memo_ttl_s:
+                memo.move_to_end(key)
+                return hit[1]
+
+        path = self.cache_path_json(*key)
+        data = self._read_json_file(path)
+        if data is _MISSING:
+            r = self._get(url, params)
+            if r.status_code not in (200, 404, 410):
+                return None
+            data = json_loads(r.content) if r.status_code == 200 else None
+            self._write_json_file(path, data)
+
+        with self._json_memo_lock:
+            memo[key] = (now, data)
+            memo.move_to_end(key)
+            while len(memo) > self.memo_maxsize:
+                memo.popitem(last=False)
+        return data
+
+    def _read_json_file(self, path: str) -> Any:
+        """Parsed contents of a json_*.json file younger than memo_ttl_s, else _MISSING."""
+        age = self._cached_age(path)
+        if age is None or age >= self.memo_ttl_s:
+            return _MISSING
+        try:
+            with open(path, "rb") as f:
+                return json_loads(f.read())
+        except Exception:
+            return _MISSING
+
+    def _write_json_file(self, path: str, data: Any) -> None:
+        tmp = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            payload = _json_dumps(data)
+            with open(tmp, "wb") as f:
+                f.write(payload)
+            os.replace(tmp, path)
+            self._note_written(path, len(payload))
+        except Exception:
+            try:
+                if os.path.exists(tmp):
+                    os.remove(tmp)
+            except Exception:
+                pass
 
     def _search_openlibrary_best(self, *, title: str, author: str) -> Optional[Tuple[Optional[int], str]]:
         """
@@ -231,15 +897,9 @@ class CoverCache:
         }
 
         try:
-            r = requests.get(
-                self.base_search_url,
-                params=params,
-                timeout=self.timeout_s,
-                headers={"User-Agent": self.user_agent},
-            )
-            if r.status_code != 200:
+            data = self._get_json(self.base_search_url, params)
+            if not isinstance(data, dict):
                 return None
-            data = r.json()
             docs = data.get("docs") or []
             if not isinstance(docs, list):
                 return None
@@ -275,9 +935,16 @@ class CoverCache:
         if not q_title and not q_author:
             return None
 
+        # Already answered by a search_batch() call?
+        batch_key = (_match_text(q_title), _match_text(q_author))
+        with self._json_memo_lock:
+            doc = self._batch_docs.get(batch_key)
+        if doc is not None:
+            return doc
+
         params: Dict[str, str] = {
             "limit": "10",
-            "fields": "title,author_name,cover_i,isbn,key,edition_key,first_publish_year",
+            "fields": _SEARCH_EXTRAS_FIELDS,
         }
         if q_title:
             params["title"] = q_title
@@ -285,37 +952,82 @@ class CoverCache:
             params["author"] = q_author
 
         try:
-            r = requests.get(
-                "https://openlibrary.org/search.json",
-                params=params,
-                timeout=self.timeout_s,
-                headers={"User-Agent": self.user_agent},
-            )
-            if r.status_code != 200:
+            payload = self._get_json("https://openlibrary.org/search.json", params)
+            if not isinstance(payload, dict):
                 return None
-            payload = r.json()
             docs = payload.get("docs")
             if not isinstance(docs, list) or not docs:
                 return None
+            return _best_search_doc(docs)
+        except Exception:
+            return None
 
-            # Prefer: has cover_i and matches roughly
-            for d in docs:
-                if not isinstance(d, dict):
-                    continue
-                if d.get("cover_i"):
-                    return d
+    def search_batch(
+        self, items: Sequence[Tuple[str, str]], chunk_size: int = 20
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Resolve many (title, author) pairs with one /search.json request per
+        chunk_size items (an OR query), instead of one request per book.
 
-            # Otherwise return the first doc that has ISBNs
+        Returns the best doc per input (as _search_openlibrary_best_extras would),
+        or None where nothing in the combined results matched. Matches are kept so
+        later get_cover_and_summary calls for those books skip their own search;
+        unmatched books still get an individual search then.
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(items)
+        pending = [
+            (i, (title or "").strip(), (author or "").strip())
+            for i, (title, author) in enumerate(items)
+            if (title or "").strip()
+        ]
+        for start in range(0, len(pending), chunk_size):
+            chunk = pending[start:start + chunk_size]
+            clauses = []
+            for _, title, author in chunk:
+                clause = f'title:"{_solr_quote(title)}"'
+                if _match_text(author):
+                    # Word match, not a phrase: LibraryThing has "Last, First", Open Library "First Last"
+                    clause = f'({clause} AND author:({_match_text(author)}))'
+                clauses.append(clause)
+            params = {
+                "q": " OR ".join(clauses),
+                "limit": str(len(chunk) * 3),
+                "fields": _SEARCH_EXTRAS_FIELDS,
+            }
+            try:
+                payload = self._get_json(self.base_search_url, params)
+            except Exception:
+                continue
+            docs = payload.get("docs") if isinstance(payload, dict) else None
+            if not isinstance(docs, list):
+                continue
+
+            # Bucket docs by normalized title; subtitles ("Title: Sub") also file under "title"
+            by_title: Dict[str, List[Dict[str, Any]]] = {}
             for d in docs:
-                if not isinstance(d, dict):
+                if not isinstance(d, dict) or not isinstance(d.get("title"), str):
                     continue
-                isbns = d.get("isbn")
-                if isinstance(isbns, list) and isbns:
-                    return d
-
-            return None
-        except Exception:
-            return None
+                t = _match_text(d["title"])
+                by_title.setdefault(t, []).append(d)
+                short = _match_text(d["title"].split(":", 1)[0])
+                if short != t:
+                    by_title.setdefault(short, []).append(d)
+
+            for i, title, author in chunk:
+                candidates = by_title.get(_match_text(title)) or by_title.get(
+                    _match_text(title.split(":", 1)[0])) or []
+                if author:
+                    want = set(_match_text(author).split())
+                    candidates = [
+                        d for d in candidates
+                        if any(want & set(_match_text(str(a)).split()) for a in (d.get("author_name") or []))
+                    ]
+                doc = _best_search_doc(candidates) if candidates else None
+                if doc is not None:
+                    results[i] = doc
+                    with self._json_memo_lock:
+                        self._batch_docs[(_match_text(title), _match_text(author))] = doc
+        return results
 
     def _extract_description_from_work_json(self, work_json: Any) -> str:
         desc = work_json.get("description") if isinstance(work_json, dict) else None
@@ -328,46 +1040,24 @@ class CoverCache:
         return ""
 
     def _fetch_work_description(self, work_key: str) -> str:
+        """work_key in canonical "/works/OL123W" form (see _canon_work_key)."""
         if not work_key:
             return ""
         try:
-            key = str(work_key).strip()
-            # Open Library keys are usually like "/works/OL123W" but sometimes show up as "OL123W" or "works/OL123W".
-            if key.startswith("works/"):
-                key = "/" + key
-            if not key.startswith("/"):
-                # Assume bare work id
-                key = "/works/" + key
-            # If a full URL was accidentally passed, keep only the path
-            if key.startswith("http://") or key.startswith("https://"):
-                # very defensive; shouldn't normally happen
-                key = "/" + key.split("openlibrary.org", 1)[-1].lstrip("/")
-            # work_key like '/works/OL123W'
-            url = "https://openlibrary.org" + key + ".json"
-            r = requests.get(url, timeout=self.timeout_s, headers={"User-Agent": self.user_agent})
-            if r.status_code != 200:
-                return ""
-            return self._extract_description_from_work_json(r.json())
+            url = f"https://openlibrary.org{work_key}.json"
+            return self._extract_description_from_work_json(self._get_json(url))
         except Exception:
             return ""
 
     def _fetch_edition_description(self, edition_key: str) -> str:
+        """edition_key in canonical "OL123M" form (see _canon_edition_key)."""
         if not edition_key:
             return ""
         try:
-            # edition_key like 'OL123M' (sometimes), or sometimes '/books/OL123M'
-            key = str(edition_key).strip()
-            if key.startswith("books/"):
-                key = key[len("books/"):]
-            if key.startswith("/books/"):
-                key = key[len("/books/"):]
-            if key.startswith("/"):
-                key = key.lstrip("/")
-            url = f"https://openlibrary.org/books/{key}.json"
-            r = requests.get(url, timeout=self.timeout_s, headers={"User-Agent": self.user_agent})
-            if r.status_code != 200:
+            url = f"https://openlibrary.org/books/{edition_key}.json"
+            data = self._get_json(url)
+            if not isinstance(data, dict):
                 return ""
-            data = r.json()
             # editions can include description directly
             desc = data.get("description")
             if isinstance(desc, str):
@@ -378,17 +1068,28 @@ class CoverCache:
         except Exception:
             return ""
 
+    def _fetch_doc_description(self, doc: Dict[str, Any]) -> str:
+        """Description for a search doc: its work's, else its first edition's."""
+        wk = _canon_work_key(doc.get("key") if isinstance(doc.get("key"), str) else "")
+        edk = ""
+        ek = doc.get("edition_key")
+        if isinstance(ek, list) and ek:
+            edk = str(ek[0])
+        elif isinstance(ek, str):
+            edk = ek
+        edk = _canon_edition_key(edk)
+        return self._fetch_work_description(wk) or self._fetch_edition_description(edk)
+
     def _fetch_description_by_isbn(self, isbn: str) -> str:
         safe = normalize_isbn(isbn)
-        if not safe:
+        if not is_plausible_isbn(safe):
             return ""
         try:
             # edition lookup by ISBN
             url = f"https://openlibrary.org/isbn/{safe}.json"
-            r = requests.get(url, timeout=self.timeout_s, headers={"User-Agent": self.user_agent})
-            if r.status_code != 200:
+            data = self._get_json(url)
+            if not isinstance(data, dict):
                 return ""
-            data = r.json()
             # direct description
             desc = data.get("description")
             if isinstance(desc, str):
@@ -399,7 +1100,7 @@ class CoverCache:
             if isinstance(works, list) and works:
                 wk = works[0].get("key") if isinstance(works[0], dict) else None
                 if isinstance(wk, str):
-                    return self._fetch_work_description(wk)
+                    return self._fetch_work_description(_canon_work_key(wk))
             return ""
         except Exception:
             return ""
@@ -412,21 +1113,23 @@ class CoverCache:
         title: str = "",
         author: str = "",
         force_refresh: bool = False,
-        want_summary: bool = True,
+        want_summary: bool = False,
     ) -> Dict[str, Any]:
         """
         Returns {'path': <local path or None>, 'summary': <string>}.
         - Tries ISBN cover first (if provided)
         - Falls back to searching by title/author when needed
-        - Optionally fetches a description/summary from Open Library
+        - Optionally (want_summary) fetches a description/summary from Open Library;
+          that costs extra requests, so callers that only paint covers leave it off
+          and use get_summary / fetch_summary_async when the text is needed
         """
         safe_isbn = normalize_isbn(isbn)
         isbn_summary = ""
 
         # 1) ISBN attempt
-        if safe_isbn:
+        if is_plausible_isbn(safe_isbn):
             out_path = self.cache_path_isbn(safe_isbn, size)
-            if (not force_refresh) and os.path.exists(out_path) and os.path.getsize(out_path) > 0:
+            if (not force_refresh) and self._cache_hit(out_path):
                 summary = self._fetch_description_by_isbn(safe_isbn) if want_summary else ""
                 return {"path": out_path, "summary": summary}
 
@@ -447,20 +1150,13 @@ class CoverCache:
 
         summary = isbn_summary
         if want_summary:
-            wk = doc.get("key") if isinstance(doc.get("key"), str) else ""
-            edk = ""
-            ek = doc.get("edition_key")
-            if isinstance(ek, list) and ek:
-                edk = str(ek[0])
-            elif isinstance(ek, str):
-                edk = ek
-            summary = self._fetch_work_description(wk) or self._fetch_edition_description(edk)
+            summary = self._fetch_doc_description(doc)
 
         # Try cover_i
         cover_i = doc.get("cover_i")
         if isinstance(cover_i, int):
             out_path = self.cache_path_coverid(cover_i, size)
-            if (not force_refresh) and os.path.exists(out_path) and os.path.getsize(out_path) > 0:
+            if (not force_refresh) and self._cache_hit(out_path):
                 return {"path": out_path, "summary": summary}
             url = self.openlibrary_url_coverid(cover_i, size)
             path = self._download_to(url, out_path, force_refresh=force_refresh)
@@ -473,7 +1169,7 @@ class CoverCache:
             best = choose_best_isbn(*[str(x) for x in isbns])
             if best:
                 out_path = self.cache_path_isbn(best, size)
-                if (not force_refresh) and os.path.exists(out_path) and os.path.getsize(out_path) > 0:
+                if (not force_refresh) and self._cache_hit(out_path):
                     return {"path": out_path, "summary": summary}
                 url = self.openlibrary_url_isbn(best, size)
                 path = self._download_to(url, out_path, force_refresh=force_refresh)
@@ -482,6 +1178,34 @@ class CoverCache:
 
         return {"path": None, "summary": summary}
 
+    def get_summary(self, isbn: str = "", *, title: str = "", author: str = "") -> str:
+        """
+        Open Library description for a book: by ISBN first, then via the
+        title/author search doc's work/edition. "" if none is found.
+        """
+        safe_isbn = normalize_isbn(isbn)
+        if is_plausible_isbn(safe_isbn):
+            summary = self._fetch_description_by_isbn(safe_isbn)
+            if summary:
+                return summary
+        if not title and not author:
+            return ""
+        doc = self._search_openlibrary_best_extras(title=title, author=author)
+        return self._fetch_doc_description(doc) if doc else ""
+
+    def fetch_summary_async(
+        self,
+        isbn: str = "",
+        *,
+        title: str = "",
+        author: str = "",
+        on_done: Callable[[str], None],
+    ) -> None:
+        """
+        Run get_summary on the background pool and call on_done(summary).
+        """
+        self._submit(on_done, "", self.get_summary, isbn, title=title, author=author)
+
     def fetch_async_extras(
         self,
         *,
@@ -497,17 +1221,14 @@ class CoverCache:
         Async version of get_cover_and_summary.
         Calls on_done(extras_dict) on completion.
         """
-        def worker():
-            result = self.get_cover_and_summary(
-                isbn=isbn,
-                size=size,
-                title=title,
-                author=author,
-                want_summary=want_summary,
-                force_refresh=force_refresh,
-            )
-            if on_done:
-                on_done(result)
-
-        t = threading.Thread(target=worker, daemon=True)
-        t.start()
+        self._submit(
+            on_done,
+            {"path": None, "summary": ""},
+            self.get_cover_and_summary,
+            isbn=isbn,
+            size=size,
+            title=title,
+            author=author,
+            want_summary=want_summary,
+            force_refresh=force_refresh,
+        )
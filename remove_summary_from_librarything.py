@@ -9,16 +9,65 @@ Input format (top-level object):
   ...
 }
 
-By default, writes to "<input>.summary_emptied.json".
-Use --in-place to overwrite the input file.
+By default, writes compact JSON to "<input>.summary_emptied.json".
+Use --in-place to overwrite the input file, --pretty for 2-space indentation.
+
+With ijson installed (pip install ijson) the export is streamed record by
+record, so memory use stays flat however large the file is. orjson (pip install
+orjson) is used for encoding/decoding when available. For very large exports,
+--jobs N spreads the record encoding over N worker processes.
 """
 
 from __future__ import annotations
 
 import argparse
 import json
+import os
+import shutil
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict
+from typing import IO, Any, Dict, Iterable, Iterator, List, Tuple
+
+# Optional streaming JSON parser
+try:
+    import ijson  # type: ignore
+    _HAS_IJSON = True
+except Exception:
+    ijson = None  # type: ignore
+    _HAS_IJSON = False
+
+# Optional fast JSON
+try:
+    import orjson  # type: ignore
+    _HAS_ORJSON = True
+except Exception:
+    orjson = None  # type: ignore
+    _HAS_ORJSON = False
+
+
+def _json_loads(raw: bytes) -> Any:
+    if _HAS_ORJSON:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # NaN/Infinity and integers past 64 bits parse only with stdlib json
+            pass
+    return json.loads(raw)
+
+
+def _json_dumps(obj: Any, pretty: bool = False) -> bytes:
+    """UTF-8 JSON bytes: compact, or indented by 2 spaces when pretty."""
+    if _HAS_ORJSON:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+        except orjson.JSONEncodeError:
+            # e.g. integers beyond 64 bits; stdlib handles these.
+            pass
+    if pretty:
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
 
 
 def empty_summaries(data: Any) -> int:
@@ -29,14 +78,107 @@ def empty_summaries(data: Any) -> int:
     if not isinstance(data, dict):
         raise ValueError("Expected the JSON root to be an object/dict.")
 
+    # Parsed JSON objects are plain dicts, so an exact type check suffices
     touched = 0
-    for _, book in data.items():
-        if isinstance(book, dict):
+    for book in data.values():
+        if book.__class__ is dict:
             book["summary"] = ""
             touched += 1
     return touched
 
 
+# Records handed to a worker process at a time by --jobs
+BATCH_SIZE = 10_000
+
+
+def _layout(pretty: bool) -> Tuple[bytes, bytes, bytes, bytes]:
+    """(lead, sep, colon, tail) around top-level members, matching _json_dumps."""
+    if pretty:
+        return b"\n  ", b",\n  ", b": ", b"\n}"
+    return b"", b",", b":", b"}"
+
+
+def _encode_batch(batch: List[Tuple[str, Any]], pretty: bool = False) -> Tuple[bytes, int]:
+    """
+    Empties the summaries in a batch of (book_id, book) records and encodes them
+    as comma-separated object members (no braces). Returns (blob, touched).
+    Module-level so it can run in a worker process.
+    """
+    _, sep, colon, _ = _layout(pretty)
+    parts = []
+    touched = 0
+    for book_id, book in batch:
+        if book.__class__ is dict:
+            book["summary"] = ""
+            touched += 1
+        body = _json_dumps(book, pretty)
+        if pretty:
+            body = body.replace(b"\n", b"\n  ")
+        parts.append(_json_dumps(book_id) + colon + body)
+    return sep.join(parts), touched
+
+
+def _batches(records: Iterable[Tuple[str, Any]], size: int) -> Iterator[List[Tuple[str, Any]]]:
+    it = iter(records)
+    while True:
+        batch = list(islice(it, size))
+        if not batch:
+            return
+        yield batch
+
+
+def write_records(records: Iterable[Tuple[str, Any]], fout: IO[bytes], pretty: bool = False, jobs: int = 1) -> int:
+    """
+    Writes (book_id, book) records to fout as one JSON object with every summary
+    emptied, laid out as _json_dumps(data, pretty) would. With jobs > 1 the
+    batches are encoded in that many worker processes and written back in order.
+    Returns the number of records touched.
+    """
+    lead, sep, _, tail = _layout(pretty)
+    touched = 0
+    first = True
+    fout.write(b"{")
+
+    def emit(blob: bytes, n: int) -> None:
+        nonlocal touched, first
+        touched += n
+        if blob:
+            fout.write(lead if first else sep)
+            fout.write(blob)
+            first = False
+
+    if jobs <= 1:
+        for batch in _batches(records, BATCH_SIZE):
+            emit(*_encode_batch(batch, pretty))
+    else:
+        # Keep only a couple of batches per worker in flight so memory stays bounded
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            pending: deque = deque()
+            for batch in _batches(records, BATCH_SIZE):
+                pending.append(pool.submit(_encode_batch, batch, pretty))
+                if len(pending) >= 2 * jobs:
+                    emit(*pending.popleft().result())
+            while pending:
+                emit(*pending.popleft().result())
+
+    fout.write(b"}" if first else tail)
+    return touched
+
+
+def empty_summaries_stream(fin: IO[bytes], fout: IO[bytes], pretty: bool = False, jobs: int = 1) -> int:
+    """
+    Streaming version of empty_summaries (needs ijson): reads the export from
+    fin one top-level record at a time and writes the result to fout, laid out
+    as _json_dumps(data, pretty) would. Returns the number of records touched.
+    """
+    head = fin.read(64).lstrip()
+    if not head.startswith(b"{"):
+        raise ValueError("Expected the JSON root to be an object/dict.")
+    fin.seek(0)
+
+    return write_records(ijson.kvitems(fin, "", use_float=True), fout, pretty=pretty, jobs=jobs)
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(description='Make all "summary" fields empty in a JSON file.')
     parser.add_argument("input", help="Path to input JSON file")
@@ -51,27 +193,55 @@ def main() -> int:
         action="store_true",
         help="Overwrite the input file (creates a .bak backup first)",
     )
+    parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="Indent the output JSON by 2 spaces (default: compact)",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Encode records in N worker processes, for very large exports (0 = one per CPU; default: 1)",
+    )
     args = parser.parse_args()
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
 
     in_path = Path(args.input)
 
     if not in_path.exists():
         raise FileNotFoundError(f"Input file not found: {in_path}")
 
-    with in_path.open("r", encoding="utf-8") as f:
-        data: Dict[str, Any] = json.load(f)
-
-    touched = empty_summaries(data)
-
     if args.in_place:
         backup_path = in_path.with_suffix(in_path.suffix + ".bak")
-        backup_path.write_text(in_path.read_text(encoding="utf-8"), encoding="utf-8")
+        shutil.copyfile(in_path, backup_path)
         out_path = in_path
     else:
         out_path = Path(args.output) if args.output else in_path.with_suffix(in_path.suffix + ".summary_emptied.json")
 
-    with out_path.open("w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    if _HAS_IJSON:
+        # Stream into a temp file next to the output; the input may be the output.
+        tmp_path = out_path.with_name(out_path.name + ".tmp")
+        try:
+            with in_path.open("rb") as fin, tmp_path.open("wb") as fout:
+                touched = empty_summaries_stream(fin, fout, pretty=args.pretty, jobs=jobs)
+            os.replace(tmp_path, out_path)
+        finally:
+            if tmp_path.exists():
+                tmp_path.unlink()
+    else:
+        data: Dict[str, Any] = _json_loads(in_path.read_bytes())
+
+        if jobs > 1:
+            if not isinstance(data, dict):
+                raise ValueError("Expected the JSON root to be an object/dict.")
+            with out_path.open("wb") as fout:
+                touched = write_records(data.items(), fout, pretty=args.pretty, jobs=jobs)
+        else:
+            touched = empty_summaries(data)
+
+            out_path.write_bytes(_json_dumps(data, pretty=args.pretty))
 
     print(f"Updated {touched} book records. Wrote: {out_path}")
     if args.in_place: